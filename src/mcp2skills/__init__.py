@@ -5,11 +5,24 @@ MCP2Skills converts MCP (Model Context Protocol) servers into Claude Skills
 following Anthropic's best practices for progressive disclosure and context efficiency.
 """
 
+import importlib
+from typing import Any
+
 __version__ = "0.2.0"
 __author__ = "junerver"
 
-from mcp2skills.ai_generator import AISkillGenerator
-from mcp2skills.config import Settings
-from mcp2skills.converter import MCPToSkillConverter
-
 __all__ = ["MCPToSkillConverter", "AISkillGenerator", "Settings"]
+
+# Exports are imported on first access, so importing a submodule (such as the
+# CLI) does not load the converter and the MCP SDK up front
+_EXPORTS = {
+    "MCPToSkillConverter": "mcp2skills.converter",
+    "AISkillGenerator": "mcp2skills.ai_generator",
+    "Settings": "mcp2skills.config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module 'mcp2skills' has no attribute {name!r}")
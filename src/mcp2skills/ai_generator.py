@@ -1,19 +1,86 @@
 """AI-powered skill generator using LLM."""
 
+import asyncio
+import importlib.util
 import json
 import os
-from typing import Any
+import random
+import re
+import sqlite3
+import time
+from collections.abc import Coroutine
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from mcp2skills import ai_generator_batch
+from mcp2skills.config import Settings
+from mcp2skills.llm_cache import LLMCache, make_cache_key, make_param_key
+from mcp2skills.utils import aio
+from mcp2skills.utils.console import console
 
-from openai import OpenAI
-from rich.console import Console
+# openai is imported where a client is created; it is slow to import and
+# commands that never reach the LLM should not pay for it
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
 
-from mcp2skills.config import Settings
+T = TypeVar("T")
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# HTTP/2 lets concurrent requests share one connection, but httpx needs h2 for it
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Connection pool shared by all requests of one client
+_HTTP_LIMITS = {"max_connections": 100, "max_keepalive_connections": 50}
+_HTTP_TIMEOUT = 60.0
 
-console = Console()
+# Responses worth retrying on the raw HTTP path: rate limits and server errors
+_RETRY_STATUSES = frozenset({408, 409, 429, 500, 502, 503, 504})
+_RETRY_MAX_DELAY = 30.0
 
 # Debug mode from environment
 DEBUG = os.getenv("MCP2SKILLS_DEBUG", "").lower() in ("true", "1", "yes")
 
+# Parameters per batched description request, to keep replies within output limits
+PARAM_BATCH_SIZE = 50
+
+# Descriptions are cut off past this many words (the prompt asks for 50-100)
+DESCRIPTION_MAX_WORDS = 110
+
+# Streamed tool descriptions are abandoned past this many words (the prompt asks for 1-2 sentences)
+TOOL_DESCRIPTION_MAX_WORDS = 60
+
+# Words in a tool or parameter name; "_", "-" and other punctuation separate them
+_WORD_RE = re.compile(r"[^\W_]+")
+
+# Descriptions for common parameter names, matched exactly and then as substrings
+_PARAM_PATTERNS = {
+    "owner": "Repository owner (username or organization)",
+    "repo": "Repository name",
+    "path": "File or directory path",
+    "url": "URL to access",
+    "query": "Search query string",
+    "content": "Content to write or send",
+    "message": "Message text",
+    "branch": "Git branch name",
+    "title": "Title text",
+    "body": "Body content or description",
+    "name": "Name identifier",
+    "id": "Unique identifier",
+    "page": "Page number for pagination",
+    "per_page": "Number of results per page",
+    "state": "Current state or status",
+    "sort": "Sort order or field",
+}
+_PARAM_PATTERN_ITEMS = tuple(_PARAM_PATTERNS.items())
+
 
 SYSTEM_PROMPT = """You are an expert at creating AI assistant skills following Anthropic's best practices.
 
@@ -56,22 +123,88 @@ The `description` field is the ONLY thing the AI reads to decide when to use a s
 """
 
 
+def _compact_json(obj: Any) -> str:
+    """Serialize JSON for a prompt without whitespace, which only costs tokens."""
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _cap_words(text: str, max_words: int) -> str:
+    """Cut text down to max_words words, then back to its last complete sentence if it has one."""
+    words = text.split()
+    if len(words) <= max_words:
+        return text
+    text = " ".join(words[:max_words])
+    return text[: text.rfind(".") + 1] or text
+
+
+class _RateLimiter:
+    """Token bucket allowing `per_minute` units per minute, with bursts up to that size."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+        # Waiters are served in order, so a large request is not starved by small ones
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until `amount` units are available, then take them."""
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.level >= amount:
+                    self.level -= amount
+                    return
+                await asyncio.sleep((amount - self.level) / self.rate)
+
+
 class AISkillGenerator:
     """AI-powered skill content generator."""
 
     def __init__(self, settings: Settings):
         self.settings = settings
         self.client: OpenAI | None = None
-
+        # agenerate_all() results, keyed by server name
+        self._all_results: dict[str, dict[str, Any]] = {}
+        # Async client and request limiter, recreated for each event loop they are used on
+        self._async_client: AsyncOpenAI | None = None
+        self._async_semaphore: asyncio.Semaphore | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        # Request and token rate limits (llm.rpm / llm.tpm), on the same event loop
+        self._rpm_limiter: _RateLimiter | None = None
+        self._tpm_limiter: _RateLimiter | None = None
+        # Raw HTTP session for llm.use_raw_http, tied to the same event loop
+        self._http_session: aiohttp.ClientSession | None = None
+
+        self._client_options: dict[str, Any] = {
+            "api_key": settings.llm.api_key,
+            "base_url": settings.llm.base_url,
+            "default_headers": {
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            },
+            # The SDK retries timeouts, connection errors, 429s and 5xx with jittered backoff
+            "max_retries": settings.llm.max_retries,
+        }
         if settings.validate_llm_config():
-            self.client = OpenAI(
-                api_key=settings.llm.api_key,
-                base_url=settings.llm.base_url,
-                default_headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                },
+            import openai
+
+            self.client = openai.OpenAI(
+                **self._client_options,
+                **self._http_client_option(httpx.Client if httpx else None),
             )
 
+        # Responses to identical requests, reused across runs when enabled
+        self.cache: LLMCache | None = None
+        if settings.llm.cache_enabled:
+            try:
+                self.cache = LLMCache()
+            except (OSError, sqlite3.Error) as e:
+                console.print(f"[yellow]LLM cache unavailable: {e}[/yellow]")
+
     def is_available(self) -> bool:
         """Check if AI generation is available."""
         return self.client is not None and self.settings.use_ai
@@ -83,16 +216,259 @@ class AISkillGenerator:
             if data:
                 console.print(f"[dim]{data}[/dim]")
 
-    def _call_llm(
-        self, messages: list[dict], max_tokens: int = 200, temperature: float = None
+    def _get_async_client(self) -> tuple["AsyncOpenAI", asyncio.Semaphore]:
+        """Return the async client and request semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client, semaphore = self._async_client, self._async_semaphore
+        if self._async_loop is not loop or client is None or semaphore is None:
+            from openai import AsyncOpenAI
+
+            client = AsyncOpenAI(
+                **self._client_options,
+                **self._http_client_option(httpx.AsyncClient if httpx else None),
+            )
+            semaphore = asyncio.Semaphore(self.settings.llm.max_concurrency)
+            self._async_client, self._async_semaphore = client, semaphore
+            rpm, tpm = self.settings.llm.rpm, self.settings.llm.tpm
+            self._rpm_limiter = _RateLimiter(rpm) if rpm else None
+            self._tpm_limiter = _RateLimiter(tpm) if tpm else None
+            self._http_session = None
+            self._async_loop = loop
+        return client, semaphore
+
+    def _use_raw_http(self) -> bool:
+        """Whether async requests should bypass the SDK and POST with aiohttp."""
+        if not self.settings.llm.use_raw_http:
+            return False
+        if aiohttp is None:
+            self._debug_log("LLM_USE_RAW_HTTP is set but aiohttp is not installed; using the SDK")
+            return False
+        return True
+
+    def _get_http_session(self) -> "aiohttp.ClientSession":
+        """Return the keep-alive aiohttp session for the running event loop."""
+        self._get_async_client()
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=60),
+                headers={
+                    **self._client_options["default_headers"],
+                    "Authorization": f"Bearer {self.settings.llm.api_key}",
+                },
+            )
+        return self._http_session
+
+    def _http_client_option(self, client_class: type | None) -> dict[str, Any]:
+        """Build the http_client argument for an OpenAI client, if httpx is importable."""
+        if client_class is None:
+            return {}
+        return {
+            "http_client": client_class(
+                http2=_HTTP2,
+                limits=httpx.Limits(**_HTTP_LIMITS),
+                timeout=httpx.Timeout(_HTTP_TIMEOUT),
+            )
+        }
+
+    def close(self) -> None:
+        """Close the sync client's connections and the response cache."""
+        if self.client is not None:
+            self.client.close()
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+    async def aclose(self) -> None:
+        """Close the async client and HTTP session bound to the running event loop."""
+        if self._async_loop is not asyncio.get_running_loop():
+            return
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+        self._async_loop = None
+
+    def _run_sync(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine for a sync caller, closing its event loop's connections after."""
+
+        async def run_and_close() -> T:
+            try:
+                return await coro
+            finally:
+                await self.aclose()
+
+        return aio.run(run_and_close())
+
+    async def _call_llm_raw(
+        self, messages: list[dict[str, Any]], max_tokens: int, temperature: float
+    ) -> tuple[str, str | None]:
+        """POST to /chat/completions directly; returns (content, finish_reason).
+
+        Like the SDK, retries connection errors, rate limits and server errors
+        up to llm.max_retries times with exponential backoff and full jitter.
+        """
+        url = self.settings.llm.base_url.rstrip("/") + "/chat/completions"
+        payload = {
+            "model": self.settings.llm.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        max_retries = self.settings.llm.max_retries
+        attempt = 0
+        while True:
+            try:
+                async with self._get_http_session().post(url, json=payload) as resp:
+                    if resp.status >= 400:
+                        self._debug_log(f"Response Status: {resp.status}")
+                        self._debug_log(f"Response Body: {(await resp.text())[:500]}")
+                    if resp.status not in _RETRY_STATUSES or attempt >= max_retries:
+                        resp.raise_for_status()
+                        data = await resp.json(content_type=None)
+                        choice = data["choices"][0]
+                        return choice["message"]["content"], choice.get("finish_reason")
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= max_retries:
+                    raise
+            delay = random.uniform(0, min(_RETRY_MAX_DELAY, 2**attempt))
+            attempt += 1
+            self._debug_log(f"Retrying LLM request in {delay:.1f}s (retry {attempt})")
+            await asyncio.sleep(delay)
+
+    async def _acall_llm(
+        self,
+        messages: list[dict[str, Any]],
+        max_tokens: int = 200,
+        temperature: float | None = None,
+        max_words: int | None = None,
     ) -> str | None:
-        """Make an LLM API call with error handling and debug logging."""
+        """Make an LLM API call with error handling and debug logging.
+
+        At most llm.max_concurrency requests are in flight, and when llm.rpm or
+        llm.tpm is set, requests are paced to stay under those per-minute quotas.
+        With max_words set the reply is streamed, and generation is abandoned
+        once it runs past that many words, so an overlong answer is not paid
+        for in full. The raw HTTP path does not stream and just cuts the reply.
+        """
         if not self.client:
             return None
 
         if temperature is None:
             temperature = self.settings.llm.temperature
+        cache_key = self._cache_key(messages, max_tokens, temperature)
+        if (cached := self._cache_get(cache_key)) is not None:
+            self._debug_log("LLM cache hit")
+            return cached
+        self._log_request(messages, max_tokens, temperature)
+
+        client, semaphore = self._get_async_client()
+        if self._rpm_limiter is not None:
+            await self._rpm_limiter.acquire()
+        if self._tpm_limiter is not None:
+            # Prompt tokens estimated at 4 characters each, plus the completion allowance
+            prompt_chars = sum(len(message["content"]) for message in messages)
+            await self._tpm_limiter.acquire(prompt_chars // 4 + max_tokens)
+        try:
+            async with semaphore:
+                if self._use_raw_http():
+                    content, finish_reason = await self._call_llm_raw(
+                        messages, max_tokens, temperature
+                    )
+                    if max_words is not None:
+                        content = _cap_words(content, max_words)
+                elif max_words is not None:
+                    stream = await client.chat.completions.create(
+                        model=self.settings.llm.model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        stream=True,
+                    )
+                    content, finish_reason = await self._read_stream(stream, max_words)
+                else:
+                    response = await client.chat.completions.create(
+                        model=self.settings.llm.model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    )
+                    content = response.choices[0].message.content or ""
+                    finish_reason = response.choices[0].finish_reason
+            result = self._read_response(content, finish_reason, max_tokens)
+            self._cache_store(cache_key, result)
+            return result
+        except Exception as e:
+            self._report_error(e)
+            return None
+
+    def _cache_key(
+        self, messages: list[dict[str, Any]], max_tokens: int, temperature: float
+    ) -> str | None:
+        """Key identifying this request in the response cache, or None when caching is off."""
+        if self.cache is None:
+            return None
+        return make_cache_key(self.settings.llm.model, messages, temperature, max_tokens)
 
+    def _cache_get(self, cache_key: str | None) -> str | None:
+        """The cached response to a request, or None on a miss or when caching is off."""
+        if cache_key is None or self.cache is None:
+            return None
+        return self.cache.get(cache_key)
+
+    def _cache_store(self, cache_key: str | None, result: str) -> None:
+        """Remember a non-empty response for its request."""
+        if cache_key is not None and self.cache is not None and result:
+            self.cache.set(cache_key, result)
+
+    async def _read_stream(self, stream: Any, max_words: int) -> tuple[str, str | None]:
+        """Collect a streamed reply, stopping early once it exceeds max_words.
+
+        Words are counted as each delta arrives; only the word left unfinished
+        by the previous delta is looked at again. An early stop is reported as
+        finish reason "word_limit", and the text is cut back to its last
+        complete sentence when it has one.
+        """
+        parts: list[str] = []
+        finish_reason = None
+        words = 0
+        tail = ""
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                delta = choice.delta.content or ""
+                parts.append(delta)
+                finish_reason = choice.finish_reason or finish_reason
+                if not delta:
+                    continue
+                split = (tail + delta).split()
+                if split and not delta[-1].isspace():
+                    tail = split.pop()
+                else:
+                    tail = ""
+                words += len(split)
+                if words + bool(tail) > max_words:
+                    finish_reason = "word_limit"
+                    break
+        finally:
+            await stream.close()
+
+        content = "".join(parts)
+        if finish_reason == "word_limit":
+            self._debug_log(f"Stopped streaming after {max_words} words")
+            content = _cap_words(content, max_words)
+        return content, finish_reason
+
+    def _log_request(
+        self, messages: list[dict[str, Any]], max_tokens: int, temperature: float
+    ) -> None:
+        """Debug-log an outgoing LLM request."""
+        # Serializing the messages is the costly part, so skip it all unless debugging
+        if not DEBUG:
+            return
         self._debug_log(f"LLM Request to {self.settings.llm.base_url}")
         self._debug_log(
             f"Model: {self.settings.llm.model}, Temperature: {temperature}, Max tokens: {max_tokens}"
@@ -101,102 +477,290 @@ class AISkillGenerator:
             "Messages:", json.dumps(messages, indent=2, ensure_ascii=False)[:500] + "..."
         )
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.settings.llm.model,
-                messages=messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
+    def _read_response(self, content: str, finish_reason: str | None, max_tokens: int) -> str:
+        """Clean up the reply text of a chat completion, warning on truncation."""
+        result = content.strip()
+        self._debug_log(f"LLM Response (full): {result}")
+        self._debug_log(f"Finish reason: {finish_reason}")
+        if finish_reason == "length":
+            console.print(
+                f"[yellow]Warning: AI response was truncated (max_tokens={max_tokens})[/yellow]"
             )
-            result = response.choices[0].message.content.strip()
-            finish_reason = response.choices[0].finish_reason
-            self._debug_log(f"LLM Response (full): {result}")
-            self._debug_log(f"Finish reason: {finish_reason}")
-            if finish_reason == "length":
-                console.print(
-                    f"[yellow]Warning: AI response was truncated (max_tokens={max_tokens})[/yellow]"
-                )
-            return result
-        except Exception as e:
-            error_msg = str(e)
-            error_type = type(e).__name__
-            self._debug_log(f"LLM Error Type: {error_type}")
-            self._debug_log(f"LLM Error: {error_msg}")
-
-            # Try to get more details from the exception
-            if hasattr(e, "response"):
-                try:
-                    resp = e.response
-                    self._debug_log(f"Response Status: {resp.status_code}")
-                    self._debug_log(f"Response Body: {resp.text[:500]}")
-                except Exception:
-                    pass
-
-            console.print(f"[yellow]AI generation failed: {error_msg}, using fallback[/yellow]")
-            return None
+        return result
+
+    def _report_error(self, e: Exception) -> None:
+        """Report a failed LLM call; callers then use their fallback."""
+        error_msg = str(e)
+        error_type = type(e).__name__
+        self._debug_log(f"LLM Error Type: {error_type}")
+        self._debug_log(f"LLM Error: {error_msg}")
+
+        # Try to get more details from the exception
+        if hasattr(e, "response"):
+            try:
+                resp = e.response
+                self._debug_log(f"Response Status: {resp.status_code}")
+                self._debug_log(f"Response Body: {resp.text[:500]}")
+            except Exception:
+                pass
+
+        console.print(f"[yellow]AI generation failed: {error_msg}, using fallback[/yellow]")
+
+    def generate_all(self, server_name: str, tools: list[dict[str, Any]]) -> dict[str, Any]:
+        """Sync variant of agenerate_all(), for callers without an event loop."""
+        return self._run_sync(self.agenerate_all(server_name, tools))
 
     def generate_description(self, server_name: str, tools: list[dict[str, Any]]) -> str:
-        """Generate an optimized skill description."""
+        """Generate an optimized skill description (shares generate_all()'s request)."""
+        description: str = self.generate_all(server_name, tools)["description"]
+        return description
+
+    def generate_examples(self, server_name: str, tools: list[dict[str, Any]]) -> str:
+        """Generate realistic usage examples (shares generate_all()'s request)."""
+        examples: str = self.generate_all(server_name, tools)["examples"]
+        return examples
+
+    async def agenerate_all(self, server_name: str, tools: list[dict[str, Any]]) -> dict[str, Any]:
+        """Generate all AI content for a server in a single LLM call.
+
+        Returns a dict with "description", "examples", "tool_descriptions"
+        ({tool name: text}, only for tools with a missing or very short
+        description) and "param_descriptions" ({"tool.param": text}, only for
+        undocumented parameters). Anything the model omits falls back to the
+        non-AI generators or is left out. Results are memoized per server, and
+        generate_description()/generate_examples() reuse them.
+
+        The request goes through _acall_llm, so it shares llm.max_concurrency,
+        the RPM/TPM limiters and the raw HTTP path with the other async calls.
+        """
+        if server_name in self._all_results:
+            return self._all_results[server_name]
         if not self.is_available():
-            return self._fallback_description(server_name, tools)
+            return self._fallback_all(server_name, tools)
+
+        messages, wanted_tools, wanted_params = self._all_messages(server_name, tools)
+        reply = await self._acall_llm(messages, max_tokens=self.settings.llm.max_tokens)
+        return self._apply_all_reply(server_name, tools, reply, wanted_tools, wanted_params)
+
+    def generate_bulk(
+        self, servers: list[tuple[str, list[dict[str, Any]]]]
+    ) -> dict[str, dict[str, Any]]:
+        """Run agenerate_all() for many servers as one OpenAI Batch API job.
+
+        Batch requests cost half as much and draw on a separate rate limit, but
+        can take up to 24 hours, so this is meant for large regeneration runs.
+        Results are memoized exactly as agenerate_all() would memoize them;
+        servers whose request fails get the non-AI fallbacks.
+
+        Args:
+            servers: (server name, tools) for each server
+
+        Returns:
+            {server name: agenerate_all() result}
+        """
+        pending = [(name, tools) for name, tools in servers if name not in self._all_results]
+        client = self.client
+        if client is None or not self.is_available() or not pending:
+            return {
+                name: self._all_results.get(name) or self._fallback_all(name, tools)
+                for name, tools in servers
+            }
+
+        requests = []
+        wanted: dict[str, tuple[list[str], list[str]]] = {}
+        for index, (name, tools) in enumerate(pending):
+            messages, wanted_tools, wanted_params = self._all_messages(name, tools)
+            wanted[name] = (wanted_tools, wanted_params)
+            requests.append(
+                ai_generator_batch.build_request(
+                    f"{index}:all:{name}",
+                    self.settings.llm.model,
+                    messages,
+                    self.settings.llm.max_tokens,
+                    self.settings.llm.temperature,
+                )
+            )
 
-        tool_summary = self._summarize_tools(tools)
+        replies: dict[str, str | None] = {}
+        try:
+            batch_id = ai_generator_batch.submit_batch(client, requests)
+            console.print(f"[blue]Submitted {len(requests)} requests as batch {batch_id}[/blue]")
+            replies = ai_generator_batch.wait_for_batch(client, batch_id)
+        except Exception as e:
+            self._report_error(e)
+
+        for index, (name, tools) in enumerate(pending):
+            reply = replies.get(f"{index}:all:{name}")
+            self._apply_all_reply(name, tools, reply, *wanted[name])
+        return {name: self._all_results[name] for name, _ in servers}
+
+    def _fallback_all(self, server_name: str, tools: list[dict[str, Any]]) -> dict[str, Any]:
+        """agenerate_all() result built without AI."""
+        return {
+            "description": self._fallback_description(server_name, tools),
+            "examples": self._fallback_examples(server_name, tools),
+            "tool_descriptions": {},
+            "param_descriptions": {},
+        }
 
-        prompt = f"""Generate a skill description following Anthropic's best practices.
+    def _all_messages(
+        self, server_name: str, tools: list[dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], list[str], list[str]]:
+        """Build the agenerate_all() prompt.
+
+        Returns:
+            The messages, the tool names wanting descriptions, and the
+            "tool.param" keys wanting descriptions
+        """
+        # Only ask for the descriptions the converter would otherwise request one by one.
+        # Tools are listed until the summary would exceed llm.summary_budget tokens,
+        # estimated at 4 characters per token; _enhance_tools covers the rest.
+        max_chars = self.settings.llm.summary_budget * 4
+        used = 0
+        tool_lines: list[str] = []
+        wanted_tools: list[str] = []
+        wanted_params: list[str] = []
+        for tool in tools:
+            name = tool.get("name", "unknown")
+            desc = tool.get("description", "")
+
+            schema = tool.get("inputSchema", {})
+            required = set(schema.get("required", []))
+            params = []
+            param_wanted = []
+            for param_name, param_schema in schema.get("properties", {}).items():
+                req = ", required" if param_name in required else ""
+                params.append(f"{param_name} ({param_schema.get('type', 'any')}{req})")
+                if not param_schema.get("description") and (
+                    param_name.lower() not in _PARAM_PATTERNS
+                ):
+                    param_wanted.append(f"{name}.{param_name}")
+
+            params_str = f" | params: {', '.join(params)}" if params else ""
+            line = f"- {name}: {desc[:200]}{params_str}"
+            used += len(line) + 1
+            if used > max_chars and tool_lines:
+                break
+            tool_lines.append(line)
+            if not desc or len(desc) < 20:
+                wanted_tools.append(name)
+            wanted_params.extend(param_wanted)
+
+        if len(tools) > len(tool_lines):
+            tool_lines.append(f"... and {len(tools) - len(tool_lines)} more tools")
+        tool_summary = "\n".join(tool_lines)
+        wanted_tools_str = ", ".join(wanted_tools) or "(none, use {})"
+        wanted_params_str = ", ".join(wanted_params) or "(none, use {})"
+        prompt = f"""Generate documentation for this MCP server as ONE JSON object.
 
 Server Name: {server_name}
 Tools Available ({len(tools)}):
 {tool_summary}
 
-## CRITICAL LENGTH REQUIREMENT ##
-Your response MUST be between 50-100 words. Count your words before responding.
-Responses under 50 words will be REJECTED and replaced with a fallback.
+Return a JSON object with exactly these keys:
+- "description": 50-100 words. Start with what the skill does, list 3-5 specific use cases in numbered format (1), (2), (3), and end with relevant keywords for triggering.
+- "examples": a markdown code block with bash syntax holding 2-3 realistic examples, each preceded by a comment, using real tool names and the EXACT format: python executor.py --call '{{"tool": "<tool_name>", "arguments": {{...}}}}'
+- "tool_descriptions": an object mapping each of these tool names to a clear 1-2 sentence description of what it does and when to use it: {wanted_tools_str}
+- "param_descriptions": an object mapping each of these "tool.param" keys to a 5-15 word description that does not start with "The" or "A": {wanted_params_str}
 
-## Content Requirements ##
-1. Start with what the skill does (capabilities)
-2. List 3-5 specific use cases with numbered format: (1), (2), (3)
-3. Include relevant keywords for triggering
-4. Mention file types or domains if applicable
-
-## Example (75 words) ##
-"context7 provides 2 tools for accessing up-to-date software library documentation. Use when you need to: (1) resolve a package or library name to find its documentation ID, (2) fetch current API references and code examples for any library, (3) get conceptual guides and architectural information, (4) look up specific topics like hooks, routing, or authentication. Keywords: documentation, library, package, API, reference, docs."
-
-## Your Response ##
-Write a description of 50-100 words for {server_name}. Do not include quotes around your response."""
+Return ONLY the JSON object."""
 
         messages = [
             {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": prompt},
         ]
-
-        result = self._call_llm(messages, max_tokens=self.settings.llm.max_tokens)
-
-        # Validate length - description should be 50-100 words
-        if result:
-            word_count = len(result.split())
-            if word_count < 30:  # Too short, use fallback
-                self._debug_log(f"AI description too short ({word_count} words), using fallback")
-                return self._fallback_description(server_name, tools)
+        return messages, wanted_tools, wanted_params
+
+    def _apply_all_reply(
+        self,
+        server_name: str,
+        tools: list[dict[str, Any]],
+        reply: str | None,
+        wanted_tools: list[str],
+        wanted_params: list[str],
+    ) -> dict[str, Any]:
+        """Merge an agenerate_all() reply over the fallbacks and memoize the result."""
+        result = self._fallback_all(server_name, tools)
+        data = self._parse_json_object(reply)
+        if data is None:
+            self._all_results[server_name] = result
             return result
-        return self._fallback_description(server_name, tools)
+
+        description = data.get("description")
+        if isinstance(description, str) and len(description.split()) >= 30:
+            result["description"] = _cap_words(description.strip(), DESCRIPTION_MAX_WORDS)
+        else:
+            self._debug_log("AI description missing or too short, using fallback")
+
+        examples = data.get("examples")
+        if isinstance(examples, str) and examples.strip():
+            result["examples"] = examples.strip()
+
+        wanted_by_key = {"tool_descriptions": wanted_tools, "param_descriptions": wanted_params}
+        for key, wanted in wanted_by_key.items():
+            generated = data.get(key)
+            if isinstance(generated, dict):
+                result[key] = {
+                    name: text.strip()
+                    for name, text in generated.items()
+                    if name in wanted and isinstance(text, str) and text.strip()
+                }
+
+        self._all_results[server_name] = result
+        return result
+
+    def _parse_json_object(self, text: str | None) -> dict[str, Any] | None:
+        """Parse an LLM reply that should be a JSON object, tolerating code fences."""
+        if not text:
+            return None
+        if text.startswith("```"):
+            text = text.split("\n", 1)[-1].rsplit("```", 1)[0]
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            self._debug_log("AI response was not valid JSON", text[:500])
+            return None
+        return data if isinstance(data, dict) else None
 
     def enhance_tool_description(self, tool: dict[str, Any]) -> str:
         """Enhance a tool's description using AI."""
+        return self._run_sync(self.enhance_tool_descriptions([tool]))[0]
+
+    async def enhance_tool_descriptions(self, tools: list[dict[str, Any]]) -> list[str]:
+        """Enhance several tools' descriptions concurrently; returns them in order."""
+
+        async def enhance_one(tool: dict[str, Any]) -> str:
+            original_desc: str = tool.get("description", "")
+            messages = self._tool_description_messages(tool)
+            if messages is None:
+                return original_desc
+            result = await self._acall_llm(
+                messages,
+                max_tokens=500,
+                temperature=0.3,
+                max_words=TOOL_DESCRIPTION_MAX_WORDS,
+            )
+            return result if result else original_desc
+
+        return await asyncio.gather(*(enhance_one(tool) for tool in tools))
+
+    def _tool_description_messages(self, tool: dict[str, Any]) -> list[dict[str, Any]] | None:
+        """Build the prompt to improve a tool's description, or None to keep it as is."""
         if not self.is_available():
-            return tool.get("description", "")
+            return None
 
         name = tool.get("name", "unknown")
         original_desc = tool.get("description", "")
         params = tool.get("inputSchema", {}).get("properties", {})
 
         if original_desc and len(original_desc) > 50:
-            return original_desc
+            return None
 
         prompt = f"""Improve this MCP tool description.
 
 Tool Name: {name}
 Original Description: {original_desc or "(none)"}
-Parameters: {json.dumps(params, indent=2)}
+Parameters: {_compact_json(params)}
 
 Requirements:
 1. Write a clear, concise description (1-2 sentences)
@@ -205,7 +769,7 @@ Requirements:
 
 Return ONLY the description text."""
 
-        messages = [
+        return [
             {
                 "role": "system",
                 "content": "You are a technical writer creating tool documentation.",
@@ -213,100 +777,164 @@ Return ONLY the description text."""
             {"role": "user", "content": prompt},
         ]
 
-        result = self._call_llm(messages, max_tokens=500, temperature=0.3)
-        return result if result else original_desc
-
     def generate_parameter_description(
         self, param_name: str, param_schema: dict[str, Any], tool_name: str
     ) -> str:
         """Generate a description for a parameter that lacks one."""
+        descriptions = self.generate_parameter_descriptions_batch(
+            [(tool_name, param_name, param_schema)]
+        )
+        return descriptions[f"{tool_name}.{param_name}"]
+
+    def generate_parameter_descriptions_batch(
+        self, items: list[tuple[str, str, dict[str, Any]]]
+    ) -> dict[str, str]:
+        """Generate descriptions for many parameters with one LLM call per batch.
+
+        Args:
+            items: (tool_name, param_name, param_schema) for each undocumented parameter
+
+        Returns:
+            {"tool.param": description} for every item; any the model omits are
+            inferred from the parameter name and schema
+        """
+        return self._run_sync(self.agenerate_parameter_descriptions_batch(items))
+
+    async def agenerate_parameter_descriptions_batch(
+        self, items: list[tuple[str, str, dict[str, Any]]]
+    ) -> dict[str, str]:
+        """Async variant of generate_parameter_descriptions_batch; batches run concurrently."""
+        descriptions = self._inferred_param_descriptions(items)
         if not self.is_available():
-            return self._infer_param_description(param_name, param_schema)
-
-        prompt = f"""Generate a brief description for this API parameter.
-
-Tool: {tool_name}
-Parameter Name: {param_name}
-Schema: {json.dumps(param_schema, indent=2)}
+            return descriptions
 
-Requirements:
-1. Write 5-15 words describing what this parameter is for
-2. Be specific and actionable
-3. Don't start with "The" or "A"
-
-Return ONLY the description text."""
-
-        messages = [{"role": "user", "content": prompt}]
-        result = self._call_llm(messages, max_tokens=500, temperature=0.2)
-        return result if result else self._infer_param_description(param_name, param_schema)
-
-    def generate_examples(self, server_name: str, tools: list[dict[str, Any]]) -> str:
-        """Generate realistic usage examples."""
-        if not self.is_available():
-            return self._fallback_examples(server_name, tools)
+        pending, groups = self._dedupe_param_items(items, descriptions)
+        batches = [
+            pending[start : start + PARAM_BATCH_SIZE]
+            for start in range(0, len(pending), PARAM_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(
+                self._acall_llm(
+                    self._param_batch_messages(batch),
+                    max_tokens=max(500, 40 * len(batch)),
+                    temperature=0.2,
+                )
+                for batch in batches
+            )
+        )
+        answered: set[str] = set()
+        for result in results:
+            answered |= self._merge_param_descriptions(descriptions, result)
+        self._share_param_descriptions(descriptions, groups, answered)
+
+        return descriptions
+
+    def _dedupe_param_items(
+        self, items: list[tuple[str, str, dict[str, Any]]], descriptions: dict[str, str]
+    ) -> tuple[list[tuple[str, str, dict[str, Any]]], dict[str, tuple[str, list[str]]]]:
+        """Collapse parameters that share a tool, normalized name and schema.
+
+        Only the first of each is sent to the model. The tool is part of the key,
+        because the same name ("number", "id") can mean different things on
+        different tools. Descriptions found in the response cache, possibly from
+        a same-named tool of another server, are filled in directly, and
+        parameters with an exact _PARAM_PATTERNS match are not requested at all.
+
+        Returns:
+            The items still to request, and {representative key: (param key, duplicate keys)}
+        """
+        pending: list[tuple[str, str, dict[str, Any]]] = []
+        groups: dict[str, tuple[str, list[str]]] = {}
+        representatives: dict[str, str] = {}
+        for tool_name, param_name, param_schema in items:
+            # Common parameter names keep their canned description from _PARAM_PATTERNS
+            if param_name.lower() in _PARAM_PATTERNS:
+                continue
+            key = f"{tool_name}.{param_name}"
+            param_key = make_param_key(self.settings.llm.model, tool_name, param_name, param_schema)
+            rep = representatives.get(param_key)
+            if rep is not None:
+                groups[rep][1].append(key)
+                continue
+
+            representatives[param_key] = key
+            groups[key] = (param_key, [])
+            cached = self.cache.get(param_key) if self.cache is not None else None
+            if cached is not None:
+                descriptions[key] = cached
+            else:
+                pending.append((tool_name, param_name, param_schema))
+        return pending, groups
+
+    def _share_param_descriptions(
+        self,
+        descriptions: dict[str, str],
+        groups: dict[str, tuple[str, list[str]]],
+        answered: set[str],
+    ) -> None:
+        """Copy each representative's description to its duplicates and cache new ones."""
+        for rep, (param_key, duplicates) in groups.items():
+            for key in duplicates:
+                descriptions[key] = descriptions[rep]
+            if rep in answered and self.cache is not None:
+                self.cache.set(param_key, descriptions[rep])
+
+    def _inferred_param_descriptions(
+        self, items: list[tuple[str, str, dict[str, Any]]]
+    ) -> dict[str, str]:
+        """Non-AI descriptions for every item, keyed by "tool.param"."""
+        return {
+            f"{tool_name}.{param_name}": self._infer_param_description(param_name, param_schema)
+            for tool_name, param_name, param_schema in items
+        }
 
-        # Select representative tools
-        sample_tools = tools[:3] if len(tools) > 3 else tools
-        tool_info = "\n".join(
-            [f"- {t.get('name')}: {t.get('description', '')[:100]}" for t in sample_tools]
+    def _param_batch_messages(
+        self, batch: list[tuple[str, str, dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        """Build the prompt describing one batch of parameters."""
+        param_lines = "\n".join(
+            _compact_json({"key": f"{tool_name}.{param_name}", "schema": param_schema})
+            for tool_name, param_name, param_schema in batch
         )
 
-        prompt = f"""Generate 2-3 realistic bash examples for this skill.
+        prompt = f"""Generate brief descriptions for these API parameters.
 
-Server: {server_name}
-Sample Tools:
-{tool_info}
+Each line is one parameter: its "tool.param" key and its JSON schema.
+{param_lines}
 
 Requirements:
-1. Use actual tool names from the list
-2. Include realistic parameter values
-3. Use the EXACT format: python executor.py --call '{{"tool": "<tool_name>", "arguments": {{...}}}}'
-4. Add brief comments explaining each example
-
-Example format:
-```bash
-# Comment explaining what this does
-python executor.py --call '{{"tool": "resolve-library-id", "arguments": {{"libraryName": "react"}}}}'
-```
+1. Write 5-15 words describing what each parameter is for
+2. Be specific and actionable
+3. Don't start with "The" or "A"
 
-Return ONLY the markdown code block with bash syntax."""
+Return ONLY a JSON object mapping each key to its description."""
 
-        messages = [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": prompt},
-        ]
+        return [{"role": "user", "content": prompt}]
 
-        result = self._call_llm(messages, max_tokens=self.settings.llm.max_tokens, temperature=0.5)
-        return result if result else self._fallback_examples(server_name, tools)
+    def _merge_param_descriptions(
+        self, descriptions: dict[str, str], result: str | None
+    ) -> set[str]:
+        """Overwrite inferred descriptions with the usable ones from an LLM reply.
 
-    def _summarize_tools(self, tools: list[dict[str, Any]]) -> str:
-        """Create a summary of tools for the prompt."""
-        lines = []
-        for tool in tools[:10]:  # Limit to avoid token overflow
-            name = tool.get("name", "unknown")
-            desc = tool.get("description", "")[:80]
-            lines.append(f"- {name}: {desc}")
-        if len(tools) > 10:
-            lines.append(f"... and {len(tools) - 10} more tools")
-        return "\n".join(lines)
+        Returns the keys that were overwritten.
+        """
+        merged: set[str] = set()
+        generated = self._parse_json_object(result) or {}
+        for key, text in generated.items():
+            if key in descriptions and isinstance(text, str) and text.strip():
+                descriptions[key] = text.strip()
+                merged.add(key)
+        return merged
 
     def _fallback_description(self, server_name: str, tools: list[dict[str, Any]]) -> str:
         """Generate description without AI."""
-        tool_names = [t.get("name", "") for t in tools[:8]]
-
-        # Extract use cases from tool names
-        use_cases = []
-        for name in tool_names[:5]:
-            # Convert tool name to readable use case
-            readable = name.replace("_", " ").replace("-", " ")
-            use_cases.append(readable)
-
-        # Extract keywords from all tool names
-        keywords = set()
-        for name in tool_names:
-            for word in name.replace("_", " ").replace("-", " ").split():
-                if len(word) > 2:  # Skip short words
-                    keywords.add(word.lower())
+        # Split tool names into words once, for use cases and keywords
+        name_words = [_WORD_RE.findall(t.get("name", "")) for t in tools[:8]]
+        use_cases = [" ".join(words) for words in name_words[:5]]
+
+        # Extract keywords from all tool names, skipping short words
+        keywords = {word.lower() for words in name_words for word in words if len(word) > 2}
 
         keywords_str = ", ".join(sorted(keywords)[:8])
         use_cases_str = ", ".join(use_cases[:5]) if use_cases else "various operations"
@@ -339,33 +967,13 @@ Return ONLY the markdown code block with bash syntax."""
 
     def _infer_param_description(self, param_name: str, param_schema: dict[str, Any]) -> str:
         """Infer parameter description from name and schema."""
-        # Common parameter patterns
-        patterns = {
-            "owner": "Repository owner (username or organization)",
-            "repo": "Repository name",
-            "path": "File or directory path",
-            "url": "URL to access",
-            "query": "Search query string",
-            "content": "Content to write or send",
-            "message": "Message text",
-            "branch": "Git branch name",
-            "title": "Title text",
-            "body": "Body content or description",
-            "name": "Name identifier",
-            "id": "Unique identifier",
-            "page": "Page number for pagination",
-            "per_page": "Number of results per page",
-            "state": "Current state or status",
-            "sort": "Sort order or field",
-        }
-
         # Check for exact match
         lower_name = param_name.lower()
-        if lower_name in patterns:
-            return patterns[lower_name]
+        if lower_name in _PARAM_PATTERNS:
+            return _PARAM_PATTERNS[lower_name]
 
         # Check for partial match
-        for key, desc in patterns.items():
+        for key, desc in _PARAM_PATTERN_ITEMS:
             if key in lower_name:
                 return desc
 
@@ -373,9 +981,11 @@ Return ONLY the markdown code block with bash syntax."""
         param_type = param_schema.get("type", "")
         if param_type == "array":
             return f"Array of {param_name.rstrip('s')} items"
-        elif param_type == "boolean":
-            return f"Whether to enable {param_name.replace('_', ' ')}"
+
+        readable_name = param_name.replace("_", " ")
+        if param_type == "boolean":
+            return f"Whether to enable {readable_name}"
         elif param_type == "integer" or param_type == "number":
-            return f"Numeric value for {param_name.replace('_', ' ')}"
+            return f"Numeric value for {readable_name}"
 
-        return f"Value for {param_name.replace('_', ' ')}"
+        return f"Value for {readable_name}"
@@ -0,0 +1,91 @@
+"""OpenAI Batch API helpers for generating many skills' AI content at once."""
+
+import io
+import json
+import time
+from typing import TYPE_CHECKING, Any
+
+from mcp2skills.utils.console import console
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+# Seconds between batch status checks
+BATCH_POLL_INTERVAL = 30
+
+# Terminal batch states; "completed" is the only one with usable output
+_BATCH_DONE_STATES = ("completed", "failed", "expired", "cancelled")
+
+
+def build_request(
+    custom_id: str, model: str, messages: list[dict[str, Any]], max_tokens: int, temperature: float
+) -> dict[str, Any]:
+    """Build one JSONL line of a chat completions batch."""
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        },
+    }
+
+
+def submit_batch(client: "OpenAI", requests: list[dict[str, Any]]) -> str:
+    """Upload the requests as a JSONL file and start a batch; returns the batch id."""
+    payload = "\n".join(json.dumps(request, ensure_ascii=False) for request in requests)
+    batch_file = client.files.create(
+        file=("batch.jsonl", io.BytesIO(payload.encode("utf-8"))), purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    return batch.id
+
+
+def wait_for_batch(
+    client: "OpenAI", batch_id: str, poll_interval: float = BATCH_POLL_INTERVAL
+) -> dict[str, str | None]:
+    """Poll a batch until it finishes and collect its replies.
+
+    Returns:
+        {custom_id: reply text} for every request in the output file; failed
+        requests map to None. Empty if the batch did not complete.
+    """
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in _BATCH_DONE_STATES:
+            break
+        counts = batch.request_counts
+        done = f" ({counts.completed}/{counts.total} done)" if counts else ""
+        console.print(f"  [dim]Batch {batch_id}: {batch.status}{done}[/dim]")
+        time.sleep(poll_interval)
+
+    if batch.status != "completed":
+        console.print(f"[yellow]Batch {batch_id} ended as {batch.status}, using fallback[/yellow]")
+        return {}
+
+    replies: dict[str, str | None] = {}
+    if batch.output_file_id:
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if line.strip():
+                custom_id, text = _parse_output_line(json.loads(line))
+                replies[custom_id] = text
+    return replies
+
+
+def _parse_output_line(row: dict[str, Any]) -> tuple[str, str | None]:
+    """Extract (custom_id, reply text or None) from one batch output row."""
+    response = row.get("response") or {}
+    if row.get("error") or response.get("status_code") != 200:
+        return row["custom_id"], None
+    try:
+        content = response["body"]["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError):
+        return row["custom_id"], None
+    return row["custom_id"], content.strip() if isinstance(content, str) else None
@@ -5,12 +5,15 @@ import sys
 from pathlib import Path
 
 import typer
-from rich.console import Console
 from rich.panel import Panel
 
 from mcp2skills import __version__
 from mcp2skills.config import Settings
-from mcp2skills.converter import BatchConverter, MCPToSkillConverter
+from mcp2skills.utils import jsonio
+from mcp2skills.utils.console import console
+
+# mcp2skills.converter pulls in the MCP SDK, so it is imported inside the commands
+# that convert; --help, --version and init start without it
 
 # Fix Windows console encoding
 if sys.platform == "win32":
@@ -22,7 +25,6 @@ app = typer.Typer(
     help="AI-powered converter that transforms MCP servers into Claude Skills",
     add_completion=False,
 )
-console = Console()
 
 
 def version_callback(value: bool):
@@ -50,7 +52,7 @@ def main(
 def convert(
     config: Path = typer.Argument(
         ...,
-        help="Path to MCP server config file (JSON)",
+        help="Path to MCP server config file (JSON), or an mcpServers file to convert all",
         exists=True,
     ),
     output: Path | None = typer.Option(
@@ -76,7 +78,11 @@ def convert(
         help="Path to .env file for configuration",
     ),
 ):
-    """Convert a single MCP server config to a Claude Skill."""
+    """Convert a single MCP server config to a Claude Skill.
+
+    If the file holds an "mcpServers" object, every enabled server in it is
+    converted concurrently instead.
+    """
     settings = Settings.from_env(env_file)
     settings.use_ai = not no_ai
 
@@ -86,8 +92,39 @@ def convert(
         )
         settings.use_ai = False
 
+    from mcp2skills.converter import BatchConverter, MCPToSkillConverter
+
+    data = jsonio.read_json(config)
+    if isinstance(data, dict) and "mcpServers" in data:
+        batch_converter = BatchConverter(settings)
+        try:
+            results = batch_converter.convert_bundle(
+                config, output, compact_mode=compact, servers=data["mcpServers"]
+            )
+        finally:
+            batch_converter.close()
+        if not results:
+            raise typer.Exit(1)
+
+        skills_dir = output or settings.output_dir
+        console.print(
+            Panel(
+                f"[green]Created {len(results)} skills in {skills_dir}/[/green]\n\n"
+                f"To install all:\n"
+                f"  cp -r {skills_dir}/* ~/.claude/skills/",
+                title="Success",
+            )
+        )
+        return
+
     converter = MCPToSkillConverter(settings)
-    output_dir = converter.convert(config, output, compact_mode=compact)
+    try:
+        output_dir = converter.convert(config, output, compact_mode=compact, config=data)
+    except TimeoutError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from None
+    finally:
+        converter.close()
 
     console.print(
         Panel(
@@ -125,6 +162,18 @@ def batch(
         "--skip-split",
         help="Skip splitting mcpservers.json (use existing servers/)",
     ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Show which skills would be created without writing anything",
+    ),
+    jobs: int | None = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of servers to convert concurrently",
+    ),
     no_ai: bool = typer.Option(
         False,
         "--no-ai",
@@ -135,6 +184,16 @@ def batch(
         "--compact",
         help="Use compact SKILL.md with separate references (auto-detected if >10 tools)",
     ),
+    results_file: Path | None = typer.Option(
+        None,
+        "--results-file",
+        help="Append one JSON line per converted server to this file",
+    ),
+    batch_api: bool = typer.Option(
+        False,
+        "--batch-api",
+        help="Generate AI content through the OpenAI Batch API (half price, may take hours)",
+    ),
     env_file: Path | None = typer.Option(
         None,
         "--env",
@@ -151,6 +210,12 @@ def batch(
         settings.servers_dir = servers_dir
     if output_dir:
         settings.output_dir = output_dir
+    if jobs:
+        settings.batch_concurrency = jobs
+    if results_file:
+        settings.results_file = results_file
+    if batch_api:
+        settings.use_batch_api = True
 
     settings.use_ai = not no_ai
     settings.compact_mode = compact  # Store compact mode preference
@@ -161,8 +226,13 @@ def batch(
         )
         settings.use_ai = False
 
+    from mcp2skills.converter import BatchConverter
+
     batch_converter = BatchConverter(settings)
-    results = batch_converter.convert_all(skip_split=skip_split)
+    try:
+        results = batch_converter.convert_all(skip_split=skip_split, dry_run=dry_run)
+    finally:
+        batch_converter.close()
 
     if results:
         console.print(
@@ -195,6 +265,13 @@ LLM_BASE_URL=https://api.openai.com/v1
 LLM_MODEL=gpt-4o-mini
 LLM_TEMPERATURE=0.7
 LLM_MAX_TOKENS=4096
+LLM_MAX_CONCURRENCY=8
+LLM_RPM=0
+LLM_TPM=0
+LLM_MAX_RETRIES=4
+LLM_USE_RAW_HTTP=false
+LLM_CACHE_ENABLED=false
+LLM_SUMMARY_BUDGET=2000
 
 # Paths
 MCP_CONFIG_FILE=mcpservers.json
@@ -204,6 +281,9 @@ OUTPUT_DIR=skills
 # Options
 USE_AI=true
 SKILL_PREFIX=skill-
+BATCH_CONCURRENCY=4
+INTROSPECT_TIMEOUT=120
+INTROSPECTION_CACHE_TTL=0
 """
 
     output.write_text(env_content, encoding="utf-8")
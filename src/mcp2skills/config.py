@@ -3,7 +3,6 @@
 import os
 from pathlib import Path
 
-from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
 
@@ -19,6 +18,27 @@ class LLMSettings(BaseModel):
         default=0.7, ge=0.0, le=2.0, description="Temperature for generation"
     )
     max_tokens: int = Field(default=4096, ge=1, description="Maximum tokens for generation")
+    max_concurrency: int = Field(
+        default=8, ge=1, description="Maximum number of LLM requests in flight at once"
+    )
+    use_raw_http: bool = Field(
+        default=False,
+        description="Send async LLM requests with aiohttp instead of the OpenAI SDK",
+    )
+    rpm: int = Field(
+        default=0, ge=0, description="Requests per minute to stay under (0 = no limit)"
+    )
+    tpm: int = Field(default=0, ge=0, description="Tokens per minute to stay under (0 = no limit)")
+    max_retries: int = Field(
+        default=4, ge=0, description="Retries for rate-limited, failed or timed-out LLM requests"
+    )
+    summary_budget: int = Field(
+        default=2000, ge=1, description="Approximate token budget for tool summaries in prompts"
+    )
+    cache_enabled: bool = Field(
+        default=False,
+        description="Reuse responses to identical requests from ~/.mcp2skills/llm_cache.sqlite",
+    )
 
 
 class Settings(BaseModel):
@@ -47,10 +67,30 @@ class Settings(BaseModel):
         default=None,
         description="Use compact SKILL.md with separate references. None=auto-detect based on tool count",
     )
+    batch_concurrency: int = Field(
+        default=4, ge=1, description="Number of servers converted concurrently in batch mode"
+    )
+    results_file: Path | None = Field(
+        default=None, description="Optional JSONL file receiving one record per converted server"
+    )
+    use_batch_api: bool = Field(
+        default=False,
+        description="Generate AI content for batch runs with one OpenAI Batch API job",
+    )
+    introspection_cache_ttl: int = Field(
+        default=0,
+        ge=0,
+        description="Seconds to reuse a server's introspected tool list (0 = always introspect)",
+    )
+    introspect_timeout: float = Field(
+        default=120.0, gt=0, description="Timeout in seconds for MCP server introspection"
+    )
 
     @classmethod
     def from_env(cls, env_file: Path | None = None) -> "Settings":
         """Load settings from environment variables."""
+        from dotenv import load_dotenv
+
         if env_file:
             load_dotenv(env_file)
         else:
@@ -62,6 +102,13 @@ class Settings(BaseModel):
             model=os.getenv("LLM_MODEL", "gpt-4o-mini"),
             temperature=float(os.getenv("LLM_TEMPERATURE", "0.7")),
             max_tokens=int(os.getenv("LLM_MAX_TOKENS", "4096")),
+            max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "8")),
+            use_raw_http=os.getenv("LLM_USE_RAW_HTTP", "false").lower() in ("true", "1", "yes"),
+            rpm=int(os.getenv("LLM_RPM", "0")),
+            tpm=int(os.getenv("LLM_TPM", "0")),
+            max_retries=int(os.getenv("LLM_MAX_RETRIES", "4")),
+            summary_budget=int(os.getenv("LLM_SUMMARY_BUDGET", "2000")),
+            cache_enabled=os.getenv("LLM_CACHE_ENABLED", "false").lower() in ("true", "1", "yes"),
         )
 
         return cls(
@@ -71,6 +118,9 @@ class Settings(BaseModel):
             output_dir=Path(os.getenv("OUTPUT_DIR", "skills")),
             use_ai=os.getenv("USE_AI", "true").lower() in ("true", "1", "yes"),
             skill_prefix=os.getenv("SKILL_PREFIX", "skill-"),
+            batch_concurrency=int(os.getenv("BATCH_CONCURRENCY", "4")),
+            introspect_timeout=float(os.getenv("INTROSPECT_TIMEOUT", "120")),
+            introspection_cache_ttl=int(os.getenv("INTROSPECTION_CACHE_TTL", "0")),
         )
 
     def validate_llm_config(self) -> bool:
@@ -1,21 +1,47 @@
 """Core MCP to Skill converter."""
 
 import asyncio
+import copy
 import hashlib
 import json
+import os
+import re
+import time
+from collections.abc import Iterable
+from contextvars import ContextVar
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
-from rich.console import Console
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+
+try:
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.sse import sse_client
+    from mcp.client.stdio import stdio_client
+    from mcp.client.streamable_http import streamable_http_client
+
+    _HAS_MCP = True
+except ImportError:
+    _HAS_MCP = False
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 from mcp2skills.ai_generator import AISkillGenerator
 from mcp2skills.config import Settings
 from mcp2skills.templates.daemon_executor import DAEMON_EXECUTOR_TEMPLATE
 from mcp2skills.templates.daemon_service import DAEMON_SERVICE_TEMPLATE
-from mcp2skills.templates.executor import EXECUTOR_TEMPLATE
+from mcp2skills.templates.executor import EXECUTOR_TEMPLATE_BYTES
 from mcp2skills.templates.skill_md import generate_skill_md, generate_tools_reference
+from mcp2skills.utils import aio, jsonio
+from mcp2skills.utils.console import console
 
-console = Console()
+# Per-conversion output buffer. Batch mode sets it so each server's progress is
+# printed as one block instead of interleaving with concurrent conversions.
+_output_buffer: ContextVar[list[str] | None] = ContextVar("_output_buffer", default=None)
 
 # Port range for daemon services (avoid common ports)
 DAEMON_PORT_BASE = 19900
@@ -25,21 +51,145 @@ DAEMON_PORT_MAX = 19999
 # When tool count exceeds this, use compact SKILL.md with separate references
 COMPACT_MODE_THRESHOLD = 10
 
+# A generated file: destination, contents, and optional permission bits
+Artifact = tuple[Path, bytes, int | None]
+
+# Introspected tool lists kept across runs when introspection_cache_ttl > 0,
+# in the directory the skills are created in
+INTROSPECTION_CACHE_FILE = ".mcp2skills_cache.json"
+
+# package.json differs between skills only in name, description and mode, so it
+# is filled in as bytes instead of building and serializing a dict per skill
+_PACKAGE_JSON_TEMPLATE = b"""{
+  "name": %b,
+  "version": "1.0.0",
+  "description": %b,
+  "mode": "%b",
+  "dependencies": {
+    "mcp": ">=1.22.0"%b
+  }
+}"""
+# Daemon skills also need aiohttp for the daemon service
+_DAEMON_PACKAGE_DEPS = b',\n    "aiohttp": ">=3.8.0"'
+
+# Markup that marks a buffered batch message as a warning or error worth showing
+# even when the server converted successfully
+_NOTICE_MARKUP = ("[yellow]", "[red]")
+
+# Placeholders in the daemon templates, filled in per skill
+_PLACEHOLDER_RE = re.compile(rb"\{(daemon_port|daemon_timeout)\}")
+
+# Config keys that determine which server introspection talks to; names,
+# daemon flags and the like do not change the tool list
+_SERVER_IDENTITY_KEYS = ("type", "command", "args", "env", "url", "headers")
+
 
 def generate_daemon_port(server_name: str) -> int:
     """Generate a unique port number for daemon service based on server name."""
-    # Use hash to generate consistent port for same server name
-    hash_value = int(hashlib.md5(server_name.encode()).hexdigest()[:8], 16)
+    # Use hash to generate consistent port for same server name. The first four
+    # digest bytes are read directly; existing skills must keep their ports.
+    hash_value = int.from_bytes(hashlib.md5(server_name.encode()).digest()[:4], "big")
     port = DAEMON_PORT_BASE + (hash_value % (DAEMON_PORT_MAX - DAEMON_PORT_BASE))
     return port
 
 
+def _server_fingerprint(config: dict[str, Any]) -> str:
+    """Hash the parts of a server config that decide which tools it exposes."""
+    identity = {key: config.get(key) for key in _SERVER_IDENTITY_KEYS}
+    encoded = json.dumps(identity, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()
+
+
+def _tool_dicts(tools: list[Any]) -> list[dict[str, Any]]:
+    """Convert MCP Tool objects from list_tools() into plain dicts.
+
+    The schema attribute is "inputSchema" in mcp 1.x and "input_schema" in
+    later releases; it is resolved once per list rather than per tool.
+    """
+    if not tools:
+        return []
+    schema_attr = "inputSchema" if hasattr(tools[0], "inputSchema") else "input_schema"
+    get_fields = attrgetter("name", "description", schema_attr)
+    return [
+        {"name": name, "description": description or "", "inputSchema": schema or {}}
+        for name, description, schema in map(get_fields, tools)
+    ]
+
+
+def _compile_template(template: str) -> list[bytes]:
+    """Encode a template and split it into alternating literals and placeholder names."""
+    return _PLACEHOLDER_RE.split(template.encode("utf-8"))
+
+
+def _render_template(chunks: list[bytes], **values: object) -> bytes:
+    """Join compiled template chunks, substituting the placeholder values."""
+    return b"".join(
+        str(values[chunk.decode()]).encode() if i % 2 else chunk for i, chunk in enumerate(chunks)
+    )
+
+
+# The daemon templates are encoded and split once; each skill only joins bytes
+_DAEMON_EXECUTOR_CHUNKS = _compile_template(DAEMON_EXECUTOR_TEMPLATE)
+_DAEMON_SERVICE_CHUNKS = _compile_template(DAEMON_SERVICE_TEMPLATE)
+
+
+def _json_string(value: str) -> bytes:
+    """Encode a string as a JSON string literal."""
+    return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+
+def _log(message: str) -> None:
+    """Print a converter message, or buffer it if a batch buffer is active."""
+    buffer = _output_buffer.get()
+    if buffer is None:
+        console.print(message)
+    else:
+        buffer.append(message)
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """Write data to path unless the file already holds exactly those bytes."""
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def _atomic_write(path: Path, data: bytes, mode: int | None = None) -> None:
+    """Write data to a temp file beside path, then rename it into place."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    if mode is not None:
+        os.chmod(tmp_path, mode)
+    os.replace(tmp_path, path)
+
+
+async def _write_artifacts(artifacts: list[Artifact]) -> None:
+    """Create the needed directories once, then write all files concurrently."""
+    for directory in sorted({path.parent for path, _, _ in artifacts}):
+        directory.mkdir(parents=True, exist_ok=True)
+    await asyncio.gather(*(asyncio.to_thread(_atomic_write, *artifact) for artifact in artifacts))
+
+
 class MCPToSkillConverter:
     """Convert MCP server configurations to Claude Skills."""
 
     def __init__(self, settings: Settings | None = None):
         self.settings = settings or Settings.from_env()
         self.ai_generator = AISkillGenerator(self.settings)
+        # Persisted introspection results per output root, keyed by server
+        # fingerprint; each file is loaded from disk on first use
+        self._tools_caches: dict[Path, dict[str, dict[str, Any]]] = {}
+        # In-flight and finished introspections keyed by server fingerprint, so
+        # identical servers in one batch are only spawned once
+        self._introspections: dict[str, asyncio.Task[list[dict[str, Any]]]] = {}
+
+    def close(self) -> None:
+        """Release the AI generator's connections; call once conversions are done."""
+        self.ai_generator.close()
 
     def is_daemon_mode(self, config: dict[str, Any]) -> bool:
         """Check if the MCP server should run in daemon mode."""
@@ -52,27 +202,22 @@ class MCPToSkillConverter:
     async def introspect_mcp_server(self, config: dict[str, Any]) -> list[dict[str, Any]]:
         """Connect to MCP server and discover available tools."""
         server_type = config.get("type", "stdio")
-        
-        try:
-            from mcp import ClientSession
-        except ImportError:
-            console.print("[red]Error: mcp package not installed. Run: pip install mcp[/red]")
+
+        if not _HAS_MCP:
+            _log("[red]Error: mcp package not installed. Run: pip install mcp[/red]")
             return []
 
         tools = []
         
         # Handle Streamable HTTP servers
         if server_type == "streamable-http":
-            try:
-                import httpx
-                from mcp.client.streamable_http import streamable_http_client
-            except ImportError:
-                console.print("[red]Error: mcp or httpx not installed. Run: pip install mcp httpx[/red]")
+            if httpx is None:
+                _log("[red]Error: httpx not installed. Run: pip install httpx[/red]")
                 return []
             
             url = config.get("url", "")
             if not url:
-                console.print("[yellow]Warning: No URL specified for streamable-http server[/yellow]")
+                _log("[yellow]Warning: No URL specified for streamable-http server[/yellow]")
                 return []
             
             headers = config.get("headers", {})
@@ -84,28 +229,15 @@ class MCPToSkillConverter:
                         async with ClientSession(read, write) as session:
                             await session.initialize()
                             result = await session.list_tools()
-                            tools = [
-                                {
-                                    "name": tool.name,
-                                    "description": tool.description or "",
-                                    "inputSchema": tool.inputSchema if hasattr(tool, "inputSchema") else {},
-                                }
-                                for tool in result.tools
-                            ]
+                            tools = _tool_dicts(result.tools)
             except Exception as e:
-                console.print(f"[yellow]Warning: Could not introspect streamable-http server: {e}[/yellow]")
+                _log(f"[yellow]Warning: Could not introspect streamable-http server: {e}[/yellow]")
         
         # Handle SSE servers
         elif server_type in ("sse", "http"):
-            try:
-                from mcp.client.sse import sse_client
-            except ImportError:
-                console.print("[red]Error: mcp not installed. Run: pip install mcp[/red]")
-                return []
-            
             url = config.get("url", "")
             if not url:
-                console.print("[yellow]Warning: No URL specified for SSE server[/yellow]")
+                _log("[yellow]Warning: No URL specified for SSE server[/yellow]")
                 return []
             
             headers = config.get("headers", {})
@@ -115,26 +247,12 @@ class MCPToSkillConverter:
                     async with ClientSession(read, write) as session:
                         await session.initialize()
                         result = await session.list_tools()
-                        tools = [
-                            {
-                                "name": tool.name,
-                                "description": tool.description or "",
-                                "inputSchema": tool.inputSchema if hasattr(tool, "inputSchema") else {},
-                            }
-                            for tool in result.tools
-                        ]
+                        tools = _tool_dicts(result.tools)
             except Exception as e:
-                console.print(f"[yellow]Warning: Could not introspect SSE server: {e}[/yellow]")
+                _log(f"[yellow]Warning: Could not introspect SSE server: {e}[/yellow]")
         
         # Handle stdio type servers
         else:
-            try:
-                from mcp import StdioServerParameters
-                from mcp.client.stdio import stdio_client
-            except ImportError:
-                console.print("[red]Error: mcp package not installed. Run: pip install mcp[/red]")
-                return []
-
             command = config.get("command", "")
             args = config.get("args", [])
             env = config.get("env", {})
@@ -150,24 +268,101 @@ class MCPToSkillConverter:
                     async with ClientSession(read, write) as session:
                         await session.initialize()
                         result = await session.list_tools()
-                        tools = [
-                            {
-                                "name": tool.name,
-                                "description": tool.description or "",
-                                "inputSchema": tool.inputSchema if hasattr(tool, "inputSchema") else {},
-                            }
-                            for tool in result.tools
-                        ]
+                        tools = _tool_dicts(result.tools)
             except Exception as e:
-                console.print(f"[yellow]Warning: Could not introspect stdio server: {e}[/yellow]")
+                _log(f"[yellow]Warning: Could not introspect stdio server: {e}[/yellow]")
+
+        return tools
+
+    async def _introspect_with_timeout(
+        self, config: dict[str, Any], cache_dir: Path
+    ) -> list[dict[str, Any]]:
+        """Introspect MCP server, giving up after the configured timeout.
+
+        Cancellation unwinds the transport context managers, which terminates a
+        hung stdio server process. Raises TimeoutError so the conversion fails
+        instead of producing a skill with no tools.
 
+        cache_dir is the directory the skill is created in; the persisted
+        introspection cache (used when introspection_cache_ttl > 0) lives there.
+        """
+        cache_key = _server_fingerprint(config)
+        task = self._introspections.get(cache_key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._introspect_uncached(config, cache_key, cache_dir))
+            self._introspections[cache_key] = task
+        elif not task.done():
+            _log("  [dim]Sharing tool list with an identical server[/dim]")
+        # Shielded so one cancelled conversion does not cancel the shared task
+        tools = await asyncio.shield(task)
+        # Conversions edit tool descriptions in place; hand out separate copies
+        return copy.deepcopy(tools)
+
+    async def _introspect_uncached(
+        self, config: dict[str, Any], cache_key: str, cache_dir: Path
+    ) -> list[dict[str, Any]]:
+        """Introspect one server fingerprint, consulting the persisted cache first."""
+        cached = self._get_cached_tools(cache_dir, cache_key)
+        if cached is not None:
+            return cached
+
+        timeout = self.settings.introspect_timeout
+        try:
+            tools = await asyncio.wait_for(self.introspect_mcp_server(config), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"MCP server introspection timed out after {timeout:g}s") from None
+
+        # An empty list usually means introspection failed, so it is not remembered
+        if tools:
+            self._store_cached_tools(cache_dir, cache_key, tools)
         return tools
 
+    def _get_cached_tools(self, cache_dir: Path, cache_key: str) -> list[dict[str, Any]] | None:
+        """Return a copy of a cached tool list younger than introspection_cache_ttl."""
+        ttl = self.settings.introspection_cache_ttl
+        if ttl <= 0:
+            return None
+        cache = self._tools_caches.get(cache_dir)
+        if cache is None:
+            try:
+                cache = jsonio.read_json(cache_dir / INTROSPECTION_CACHE_FILE)
+            except (OSError, ValueError):
+                cache = {}
+            self._tools_caches[cache_dir] = cache
+        entry = cache.get(cache_key)
+        if entry is None:
+            return None
+        age = time.time() - entry.get("created_at", 0)
+        if age > ttl:
+            return None
+        # Shown even in batch mode: the skill reflects the server as it was then
+        _log(
+            f"  [yellow]Using tool list cached {age / 60:.0f} min ago "
+            f"(INTROSPECTION_CACHE_TTL={ttl})[/yellow]"
+        )
+        # Conversions edit tool descriptions in place; keep the cached copy pristine
+        return copy.deepcopy(entry["tools"])
+
+    def _store_cached_tools(
+        self, cache_dir: Path, cache_key: str, tools: list[dict[str, Any]]
+    ) -> None:
+        """Remember a tool list in memory and persist the whole cache, best effort."""
+        if self.settings.introspection_cache_ttl <= 0:
+            return
+        cache = self._tools_caches.setdefault(cache_dir, {})
+        cache[cache_key] = {"created_at": time.time(), "tools": copy.deepcopy(tools)}
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            _atomic_write(cache_dir / INTROSPECTION_CACHE_FILE, jsonio.dumps(cache))
+        except OSError as e:
+            _log(f"  [yellow]Warning: Could not save introspection cache: {e}[/yellow]")
+
     def convert(
         self,
         config_path: Path,
         output_dir: Path | None = None,
         compact_mode: bool | None = None,
+        config: dict[str, Any] | None = None,
     ) -> Path:
         """Convert a single MCP config to a Claude Skill.
 
@@ -177,10 +372,42 @@ class MCPToSkillConverter:
             compact_mode: If None, auto-detect based on tool count.
                          If True, use compact mode with separate references.
                          If False, include all details in SKILL.md.
+            config: config_path's contents, if the caller already parsed it
+        """
+        return aio.run(self._aconvert_and_close(config_path, output_dir, compact_mode, config))
+
+    async def _aconvert_and_close(
+        self,
+        config_path: Path,
+        output_dir: Path | None,
+        compact_mode: bool | None,
+        config: dict[str, Any] | None,
+    ) -> Path:
+        """Run aconvert, then release the AI generator's connections before the loop closes."""
+        try:
+            return await self.aconvert(config_path, output_dir, compact_mode, config=config)
+        finally:
+            await self.ai_generator.aclose()
+
+    async def aconvert(
+        self,
+        config_path: Path,
+        output_dir: Path | None = None,
+        compact_mode: bool | None = None,
+        config: dict[str, Any] | None = None,
+        tools: list[dict[str, Any]] | None = None,
+    ) -> Path:
+        """Async variant of convert() so many servers can share one event loop.
+
+        MCP introspection is awaited directly; the blocking AI and rendering
+        steps run in worker threads and the files are written concurrently,
+        so they do not stall other conversions.
+        If the caller already parsed config_path, pass it as config to skip
+        reading the file again; likewise pass already introspected tools.
         """
         # Load config
-        with open(config_path, encoding="utf-8") as f:
-            config = json.load(f)
+        if config is None:
+            config = jsonio.read_json(config_path)
 
         server_name = config.get("name", config_path.stem)
         skill_name = f"{self.settings.skill_prefix}{server_name}"
@@ -192,76 +419,163 @@ class MCPToSkillConverter:
         else:
             # If output_dir is provided, create skill subdirectory within it
             output_dir = output_dir / skill_name
-        output_dir.mkdir(parents=True, exist_ok=True)
 
         mode_str = "[daemon]" if is_daemon else "[standard]"
-        console.print(f"[blue]Converting {server_name} {mode_str}...[/blue]")
+        _log(f"[blue]Converting {server_name} {mode_str}...[/blue]")
 
         # Introspect MCP server
-        tools = asyncio.run(self.introspect_mcp_server(config))
-        console.print(f"  Found {len(tools)} tools")
-
-        # Enhance tools with AI if available
+        if tools is None:
+            tools = await self._introspect_with_timeout(config, output_dir.parent)
+        _log(f"  Found {len(tools)} tools")
+        # The executor's tool cache must match what the live server reports, so it
+        # gets the tools as introspected, before AI rewrites their descriptions
+        raw_tools = tools
+        if self.ai_generator.is_available() and not is_daemon:
+            raw_tools = copy.deepcopy(tools)
+
+        # Enhance tools with AI if available: one request covers the description,
+        # examples and missing tool/parameter descriptions (memoized, so batch API
+        # results are reused), and only what its reply left out is requested again
         if self.ai_generator.is_available():
-            console.print("  [green]Using AI to enhance descriptions...[/green]")
-            tools = self._enhance_tools(tools)
+            _log("  [green]Using AI to enhance descriptions...[/green]")
+            generated = await self.ai_generator.agenerate_all(server_name, tools)
+            tools = self._apply_generated(tools, generated)
+            tools = await self._enhance_tools(tools)
+            description = generated["description"]
+            examples = generated["examples"]
+        else:
+            description = self.ai_generator._fallback_description(server_name, tools)
+            examples = self.ai_generator._fallback_examples(server_name, tools)
+
+        artifacts = await asyncio.to_thread(
+            self._render_skill,
+            config,
+            server_name,
+            tools,
+            output_dir,
+            description,
+            examples,
+            compact_mode,
+        )
+        await _write_artifacts(artifacts)
+
+        # Seed the executor's tool cache so --list/--describe skip the server.
+        # Written after mcp-config.json because it records its digest. An empty list
+        # usually means introspection failed, so the executor is left to ask the server.
+        if not is_daemon and raw_tools:
+            await asyncio.to_thread(self._generate_tools_cache, raw_tools, output_dir)
+
+        _log(f"[green]Created skill: {output_dir}[/green]")
+        return output_dir
+
+    def _render_skill(
+        self,
+        config: dict[str, Any],
+        server_name: str,
+        tools: list[dict[str, Any]],
+        output_dir: Path,
+        description: str,
+        examples: str,
+        compact_mode: bool | None = None,
+    ) -> list[Artifact]:
+        """Render every skill file in memory, without touching the disk."""
+        is_daemon = self.is_daemon_mode(config)
 
         # Generate skill files based on mode
         daemon_timeout = self.get_daemon_timeout(config) if is_daemon else 0
-        self._generate_skill_md(
-            server_name, tools, output_dir, is_daemon, compact_mode, daemon_timeout
+        artifacts = self._generate_skill_md(
+            server_name,
+            tools,
+            output_dir,
+            description,
+            examples,
+            is_daemon,
+            compact_mode,
+            daemon_timeout,
         )
 
         if is_daemon:
             daemon_port = generate_daemon_port(server_name)
             timeout_str = f", timeout: {daemon_timeout}s" if daemon_timeout > 0 else ""
-            console.print(f"  [cyan]Daemon mode enabled (port: {daemon_port}{timeout_str})[/cyan]")
-            self._generate_daemon_executor(output_dir, daemon_port)
-            self._generate_daemon_service(output_dir, daemon_port, daemon_timeout)
+            _log(f"  [cyan]Daemon mode enabled (port: {daemon_port}{timeout_str})[/cyan]")
+            artifacts.append(self._generate_daemon_executor(output_dir, daemon_port))
+            artifacts.append(self._generate_daemon_service(output_dir, daemon_port, daemon_timeout))
         else:
-            self._generate_executor(output_dir)
+            artifacts.append(self._generate_executor(output_dir))
+
+        artifacts.append(self._generate_mcp_config(config, output_dir))
+        artifacts.append(self._generate_package_json(server_name, output_dir, is_daemon))
+        return artifacts
+
+    async def _enhance_tools(self, tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Enhance tool descriptions using AI, with the LLM requests running concurrently."""
+        # One pass collects short tool descriptions and undocumented parameters,
+        # so the parameters are described in one batch
+        short: list[dict[str, Any]] = []
+        missing_params: list[tuple[str, str, dict[str, Any]]] = []
+        for tool in tools:
+            if len(tool.get("description") or "") < 20:
+                short.append(tool)
+            name = tool.get("name", "")
+            properties = tool.get("inputSchema", {}).get("properties", {})
+            for param_name, param_schema in properties.items():
+                if not param_schema.get("description"):
+                    missing_params.append((name, param_name, param_schema))
 
-        self._generate_mcp_config(config, output_dir)
-        self._generate_package_json(server_name, output_dir, is_daemon)
+        # agenerate_all() usually leaves nothing to fill in
+        if not short and not missing_params:
+            return tools
 
-        console.print(f"[green]Created skill: {output_dir}[/green]")
-        return output_dir
+        tool_descriptions, descriptions = await asyncio.gather(
+            self.ai_generator.enhance_tool_descriptions(short),
+            self.ai_generator.agenerate_parameter_descriptions_batch(missing_params),
+        )
+        for tool, description in zip(short, tool_descriptions):
+            tool["description"] = description
+        for tool_name, param_name, param_schema in missing_params:
+            param_schema["description"] = descriptions[f"{tool_name}.{param_name}"]
+        return tools
+
+    def _apply_generated(
+        self, tools: list[dict[str, Any]], generated: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """Fill tool and parameter descriptions from an agenerate_all() result.
 
-    def _enhance_tools(self, tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        """Enhance tool descriptions using AI."""
-        enhanced = []
+        Descriptions the result lacks are left empty for _enhance_tools.
+        """
+        tool_descriptions = generated["tool_descriptions"]
+        param_descriptions = generated["param_descriptions"]
         for tool in tools:
-            # Enhance tool description
-            if not tool.get("description") or len(tool.get("description", "")) < 20:
-                tool["description"] = self.ai_generator.enhance_tool_description(tool)
+            name = tool.get("name", "")
+            if name in tool_descriptions:
+                tool["description"] = tool_descriptions[name]
 
-            # Enhance parameter descriptions
-            schema = tool.get("inputSchema", {})
-            properties = schema.get("properties", {})
+            properties = tool.get("inputSchema", {}).get("properties", {})
             for param_name, param_schema in properties.items():
-                if not param_schema.get("description"):
-                    param_schema["description"] = self.ai_generator.generate_parameter_description(
-                        param_name, param_schema, tool.get("name", "")
-                    )
-
-            enhanced.append(tool)
-        return enhanced
+                key = f"{name}.{param_name}"
+                if not param_schema.get("description") and key in param_descriptions:
+                    param_schema["description"] = param_descriptions[key]
+        return tools
 
     def _generate_skill_md(
         self,
         server_name: str,
         tools: list[dict[str, Any]],
         output_dir: Path,
+        description: str,
+        examples: str,
         is_daemon: bool = False,
         compact_mode: bool | None = None,
         daemon_timeout: int = 0,
-    ) -> None:
-        """Generate SKILL.md file.
+    ) -> list[Artifact]:
+        """Generate SKILL.md, plus references/tools.md in compact mode.
 
         Args:
             server_name: Name of the MCP server
             tools: List of tool definitions
             output_dir: Output directory for the skill
+            description: Server description for the frontmatter
+            examples: Examples section content
             is_daemon: Whether to use daemon mode
             compact_mode: If None, auto-detect based on tool count.
                          If True, use compact mode with separate references.
@@ -272,22 +586,10 @@ class MCPToSkillConverter:
             compact_mode = len(tools) > COMPACT_MODE_THRESHOLD
 
         if compact_mode:
-            console.print(
+            _log(
                 f"  [cyan]Using compact mode ({len(tools)} tools > {COMPACT_MODE_THRESHOLD})[/cyan]"
             )
 
-        # Generate description
-        if self.ai_generator.is_available():
-            description = self.ai_generator.generate_description(server_name, tools)
-        else:
-            description = self.ai_generator._fallback_description(server_name, tools)
-
-        # Generate examples
-        if self.ai_generator.is_available():
-            examples = self.ai_generator.generate_examples(server_name, tools)
-        else:
-            examples = self.ai_generator._fallback_examples(server_name, tools)
-
         content = generate_skill_md(
             server_name=server_name,
             description=description,
@@ -298,74 +600,70 @@ class MCPToSkillConverter:
             daemon_timeout=daemon_timeout,
         )
 
-        skill_path = output_dir / "SKILL.md"
-        skill_path.write_text(content, encoding="utf-8")
+        artifacts: list[Artifact] = [(output_dir / "SKILL.md", content.encode("utf-8"), None)]
 
         # Generate references/tools.md for compact mode
         if compact_mode:
-            self._generate_tools_reference(server_name, tools, output_dir)
+            artifacts.append(self._generate_tools_reference(server_name, tools, output_dir))
+        return artifacts
 
     def _generate_tools_reference(
         self,
         server_name: str,
         tools: list[dict[str, Any]],
         output_dir: Path,
-    ) -> None:
+    ) -> Artifact:
         """Generate references/tools.md file with detailed tool documentation."""
-        references_dir = output_dir / "references"
-        references_dir.mkdir(parents=True, exist_ok=True)
-
         content = generate_tools_reference(server_name, tools)
 
-        tools_ref_path = references_dir / "tools.md"
-        tools_ref_path.write_text(content, encoding="utf-8")
-        console.print("  [green]Created references/tools.md[/green]")
+        _log("  [green]Created references/tools.md[/green]")
+        return (output_dir / "references" / "tools.md", content.encode("utf-8"), None)
 
-    def _generate_executor(self, output_dir: Path) -> None:
+    def _generate_executor(self, output_dir: Path) -> Artifact:
         """Generate standard executor.py file."""
-        executor_path = output_dir / "executor.py"
-        executor_path.write_text(EXECUTOR_TEMPLATE, encoding="utf-8")
+        return (output_dir / "executor.py", EXECUTOR_TEMPLATE_BYTES, 0o755)
 
-    def _generate_daemon_executor(self, output_dir: Path, daemon_port: int) -> None:
+    def _generate_daemon_executor(self, output_dir: Path, daemon_port: int) -> Artifact:
         """Generate daemon mode executor.py file."""
-        executor_content = DAEMON_EXECUTOR_TEMPLATE.replace("{daemon_port}", str(daemon_port))
-        executor_path = output_dir / "executor.py"
-        executor_path.write_text(executor_content, encoding="utf-8")
+        content = _render_template(_DAEMON_EXECUTOR_CHUNKS, daemon_port=daemon_port)
+        return (output_dir / "executor.py", content, 0o755)
 
     def _generate_daemon_service(
         self, output_dir: Path, daemon_port: int, daemon_timeout: int = 0
-    ) -> None:
+    ) -> Artifact:
         """Generate mcp_daemon.py service file."""
-        daemon_content = DAEMON_SERVICE_TEMPLATE.replace("{daemon_port}", str(daemon_port))
-        daemon_content = daemon_content.replace("{daemon_timeout}", str(daemon_timeout))
-        daemon_path = output_dir / "mcp_daemon.py"
-        daemon_path.write_text(daemon_content, encoding="utf-8")
+        content = _render_template(
+            _DAEMON_SERVICE_CHUNKS, daemon_port=daemon_port, daemon_timeout=daemon_timeout
+        )
+        return (output_dir / "mcp_daemon.py", content, 0o755)
 
-    def _generate_mcp_config(self, config: dict[str, Any], output_dir: Path) -> None:
+    def _generate_mcp_config(self, config: dict[str, Any], output_dir: Path) -> Artifact:
         """Generate mcp-config.json file."""
-        config_path = output_dir / "mcp-config.json"
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        return (output_dir / "mcp-config.json", jsonio.dumps(config), None)
+
+    def _generate_tools_cache(self, tools: list[dict[str, Any]], output_dir: Path) -> None:
+        """Write .tools-cache.json, tied to the mcp-config.json already on disk."""
+        cache = {
+            "config_sha256": hashlib.sha256(
+                (output_dir / "mcp-config.json").read_bytes()
+            ).hexdigest(),
+            "created_at": time.time(),
+            "tools": tools,
+        }
+        (output_dir / ".tools-cache.json").write_bytes(jsonio.dumps(cache))
 
     def _generate_package_json(
         self, server_name: str, output_dir: Path, is_daemon: bool = False
-    ) -> None:
+    ) -> Artifact:
         """Generate package.json file."""
-        package = {
-            "name": f"skill-{server_name}",
-            "version": "1.0.0",
-            "description": f"Claude Skill for {server_name} MCP server",
-            "mode": "daemon" if is_daemon else "standard",
-            "dependencies": {"mcp": ">=1.22.0"},
-        }
-
-        # Add aiohttp dependency for daemon mode
-        if is_daemon:
-            package["dependencies"]["aiohttp"] = ">=3.8.0"
-
-        package_path = output_dir / "package.json"
-        with open(package_path, "w", encoding="utf-8") as f:
-            json.dump(package, f, indent=2, ensure_ascii=False)
+        mode, extra_deps = (b"daemon", _DAEMON_PACKAGE_DEPS) if is_daemon else (b"standard", b"")
+        content = _PACKAGE_JSON_TEMPLATE % (
+            _json_string(f"skill-{server_name}"),
+            _json_string(f"Claude Skill for {server_name} MCP server"),
+            mode,
+            extra_deps,
+        )
+        return (output_dir / "package.json", content, None)
 
 
 class BatchConverter:
@@ -374,71 +672,100 @@ class BatchConverter:
     def __init__(self, settings: Settings | None = None):
         self.settings = settings or Settings.from_env()
         self.converter = MCPToSkillConverter(settings)
+        # Configs parsed by split_mcp_config, keyed by the file they were written to
+        self._split_configs: dict[Path, dict[str, Any]] = {}
+
+    def close(self) -> None:
+        """Release the AI generator's connections; call once conversions are done."""
+        self.converter.close()
 
-    def split_mcp_config(self) -> int:
-        """Split mcpservers.json into individual server configs."""
+    def split_mcp_config(self) -> list[Path]:
+        """Split mcpservers.json into individual server configs.
+
+        Returns:
+            Paths of the server configs written (or left unchanged), in
+            mcpservers.json order
+        """
         config_file = self.settings.mcp_config_file
         if not config_file.exists():
             console.print(f"[red]Config file not found: {config_file}[/red]")
-            return 0
-
-        with open(config_file, encoding="utf-8") as f:
-            data = json.load(f)
-
-        mcp_servers = data.get("mcpServers", {})
-        if not mcp_servers:
-            console.print("[yellow]No mcpServers found in config[/yellow]")
-            return 0
-
-        # Clean up servers directory before splitting
-        if self.settings.servers_dir.exists():
-            for old_file in self.settings.servers_dir.glob("*.json"):
-                old_file.unlink()
+            return []
 
         self.settings.servers_dir.mkdir(parents=True, exist_ok=True)
+        self._split_configs.clear()
+
+        # Stream servers one at a time so a large config is never loaded whole
+        found = 0
+        disabled = 0
+        for server_name, server_config in jsonio.iter_object_items(config_file, "mcpServers"):
+            found += 1
 
-        count = 0
-        for server_name, server_config in mcp_servers.items():
             # Skip disabled servers
             if server_config.get("disabled", False):
-                console.print(f"  [dim]Skipping disabled: {server_name}[/dim]")
+                disabled += 1
                 continue
 
             # Add name field
             server_config["name"] = server_name
 
-            # Save to individual file
+            # Save to individual file, leaving unchanged configs untouched on re-runs
             output_file = self.settings.servers_dir / f"{server_name}.json"
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(server_config, f, indent=2, ensure_ascii=False)
+            _write_if_changed(output_file, jsonio.dumps(server_config))
+            self._split_configs[output_file] = server_config
 
-            console.print(f"  [green]OK[/green] {server_name}.json")
-            count += 1
+        if not found:
+            console.print("[yellow]No mcpServers found in config[/yellow]")
+            return []
 
+        # Remove configs left over from servers that are gone or now disabled
+        for old_file in self._list_server_configs():
+            if old_file not in self._split_configs:
+                old_file.unlink()
+
+        written = list(self._split_configs)
+        skipped = f" ({disabled} disabled skipped)" if disabled else ""
         console.print(
-            f"\n[green]Split {count} server configs to {self.settings.servers_dir}/[/green]"
+            f"\n[green]Split {len(written)} server configs to "
+            f"{self.settings.servers_dir}/{skipped}[/green]"
         )
-        return count
+        return written
+
+    def _list_server_configs(self) -> list[Path]:
+        """List *.json files in servers_dir, sorted by name."""
+        servers_dir = self.settings.servers_dir
+        with os.scandir(servers_dir) as entries:
+            names = sorted(
+                entry.name for entry in entries if entry.name.endswith(".json") and entry.is_file()
+            )
+        return [servers_dir / name for name in names]
 
-    def convert_all(self, skip_split: bool = False) -> list[Path]:
+    def convert_all(self, skip_split: bool = False, dry_run: bool = False) -> list[Path]:
         """Convert all MCP servers to Skills.
 
         Args:
             skip_split: Skip splitting mcpservers.json
+            dry_run: Only print the skills that would be created; nothing is
+                     written and no MCP server is started
 
         Returns:
             List of output directories for created skills
         """
-        # Step 1: Split config if needed
-        if not skip_split:
-            self.split_mcp_config()
-
-        # Step 2: Find all server configs
-        if not self.settings.servers_dir.exists():
-            console.print(f"[red]Servers directory not found: {self.settings.servers_dir}[/red]")
+        if dry_run:
+            self._print_plan(skip_split)
             return []
 
-        configs = sorted(self.settings.servers_dir.glob("*.json"))
+        # Step 1: Split config if needed; the split already knows which files it wrote
+        configs = [] if skip_split else self.split_mcp_config()
+
+        # Step 2: Otherwise find existing server configs
+        if not configs:
+            if not self.settings.servers_dir.exists():
+                console.print(
+                    f"[red]Servers directory not found: {self.settings.servers_dir}[/red]"
+                )
+                return []
+            configs = self._list_server_configs()
+
         if not configs:
             console.print(f"[yellow]No .json files found in {self.settings.servers_dir}[/yellow]")
             return []
@@ -448,16 +775,211 @@ class BatchConverter:
         # Get compact_mode from settings (can be None for auto-detect)
         compact_mode = getattr(self.settings, "compact_mode", None)
 
-        # Step 3: Convert each server
-        results = []
-        for config_path in configs:
-            try:
-                output_dir = self.converter.convert(config_path, compact_mode=compact_mode)
+        # Step 3: Convert servers concurrently (work is dominated by MCP/LLM I/O)
+        outcomes = aio.run(self._convert_configs(configs, compact_mode))
+
+        # Step 4: Summarize
+        return self._summarize(outcomes)
+
+    def convert_bundle(
+        self,
+        config_file: Path,
+        output_dir: Path | None = None,
+        compact_mode: bool | None = None,
+        servers: dict[str, Any] | None = None,
+    ) -> list[Path]:
+        """Convert every enabled server in an mcpServers file, without splitting it.
+
+        Args:
+            config_file: Path to a file with a top-level "mcpServers" object
+            output_dir: Directory to create the skills in (default: settings.output_dir)
+            compact_mode: If None, auto-detect per server based on tool count
+            servers: The file's already parsed "mcpServers" object; when omitted
+                     the file is streamed
+
+        Returns:
+            List of output directories for created skills
+        """
+        self._split_configs.clear()
+        items: Iterable[tuple[str, Any]]
+        if servers is None:
+            items = jsonio.iter_object_items(config_file, "mcpServers")
+        elif isinstance(servers, dict):
+            items = servers.items()
+        else:
+            console.print(f'[red]"mcpServers" in {config_file} is not an object[/red]')
+            return []
+        for server_name, server_config in items:
+            if server_config.get("disabled", False):
+                console.print(f"  [dim]Skipping disabled: {server_name}[/dim]")
+                continue
+            server_config["name"] = server_name
+            # Nothing is written; the path only labels the server in output
+            self._split_configs[Path(f"{server_name}.json")] = server_config
+
+        configs = list(self._split_configs)
+        if not configs:
+            console.print("[yellow]No mcpServers found in config[/yellow]")
+            return []
+
+        console.print(f"\n[blue]Converting {len(configs)} MCP servers...[/blue]\n")
+        outcomes = aio.run(self._convert_configs(configs, compact_mode, output_dir))
+        return self._summarize(outcomes)
+
+    async def _prefetch_with_batch_api(
+        self, configs: list[Path], semaphore: asyncio.Semaphore, output_dir: Path
+    ) -> dict[Path, list[dict[str, Any]] | BaseException]:
+        """Introspect every server, then generate all AI content in one Batch API job.
+
+        Returns the tools (or the introspection error) per config; the AI
+        results are memoized on the converter's generator for aconvert().
+        """
+
+        async def introspect_one(config_path: Path) -> tuple[str, list[dict[str, Any]]]:
+            async with semaphore:
+                config = self._split_configs.get(config_path)
+                if config is None:
+                    config = jsonio.read_json(config_path)
+                tools = await self.converter._introspect_with_timeout(config, output_dir)
+                return config.get("name", config_path.stem), tools
+
+        console.print("[blue]Introspecting servers for the batch job...[/blue]")
+        outcomes = await asyncio.gather(
+            *(introspect_one(p) for p in configs), return_exceptions=True
+        )
+        prefetched: dict[Path, list[dict[str, Any]] | BaseException] = {}
+        servers: list[tuple[str, list[dict[str, Any]]]] = []
+        for config_path, outcome in zip(configs, outcomes):
+            if isinstance(outcome, BaseException):
+                prefetched[config_path] = outcome
+            else:
+                server_name, tools = outcome
+                prefetched[config_path] = tools
+                servers.append((server_name, tools))
+
+        if servers:
+            await asyncio.to_thread(self.converter.ai_generator.generate_bulk, servers)
+        return prefetched
+
+    def _summarize(self, outcomes: list[tuple[Path, Path | None, str]]) -> list[Path]:
+        """Print the success count and failures; return the created skill dirs."""
+        results: list[Path] = []
+        failures: list[tuple[Path, str]] = []
+        for config_path, output_dir, error in outcomes:
+            if output_dir is not None:
                 results.append(output_dir)
-            except Exception as e:
-                console.print(f"[red]Failed to convert {config_path.name}: {e}[/red]")
+            else:
+                failures.append((config_path, error))
 
         console.print(
-            f"\n[green]Successfully converted {len(results)}/{len(configs)} servers[/green]"
+            f"\n[green]Successfully converted {len(results)}/{len(outcomes)} servers[/green]"
         )
+        if failures:
+            console.print(f"[red]Failed ({len(failures)}):[/red]")
+            for config_path, error in failures:
+                console.print(f"  [red]-[/red] {config_path.name}: {error}")
         return results
+
+    def _print_plan(self, skip_split: bool = False) -> None:
+        """Print the skills a batch run would create, without touching disk."""
+        if skip_split:
+            if not self.settings.servers_dir.exists():
+                console.print(
+                    f"[red]Servers directory not found: {self.settings.servers_dir}[/red]"
+                )
+                return
+            # Listing only; split configs are always named after their server
+            names = [path.stem for path in self._list_server_configs()]
+        else:
+            config_file = self.settings.mcp_config_file
+            if not config_file.exists():
+                console.print(f"[red]Config file not found: {config_file}[/red]")
+                return
+            names = [
+                name
+                for name, cfg in jsonio.iter_object_items(config_file, "mcpServers")
+                if not cfg.get("disabled", False)
+            ]
+
+        console.print(f"\n[blue]Dry run: would convert {len(names)} MCP servers[/blue]\n")
+        for name in names:
+            output_dir = self.settings.output_dir / f"{self.settings.skill_prefix}{name}"
+            console.print(f"  {name} -> {output_dir}")
+
+    async def _convert_configs(
+        self,
+        configs: list[Path],
+        compact_mode: bool | None = None,
+        output_dir: Path | None = None,
+    ) -> list[tuple[Path, Path | None, str]]:
+        """Convert configs on one event loop, at most batch_concurrency at a time.
+
+        Returns one (config_path, output_dir or None, error message) per config.
+
+        If settings.results_file is set, one JSON line per server is appended to
+        it as soon as that server finishes, so progress survives an aborted run.
+        """
+        semaphore = asyncio.Semaphore(self.settings.batch_concurrency)
+        prefetched: dict[Path, list[dict[str, Any]] | BaseException] = {}
+        if self.settings.use_batch_api and self.converter.ai_generator.is_available():
+            prefetched = await self._prefetch_with_batch_api(
+                configs, semaphore, output_dir or self.settings.output_dir
+            )
+        results_file = self.settings.results_file
+        results_log = open(results_file, "ab") if results_file else None
+
+        def record(config_path: Path, **fields: Any) -> None:
+            if results_log is None:
+                return
+            entry = {"config": str(config_path), **fields}
+            results_log.write(jsonio.dumps_line(entry))
+            results_log.flush()
+
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            console=console,
+        )
+        task_id = progress.add_task("Converting", total=len(configs))
+
+        async def convert_one(config_path: Path) -> tuple[Path, Path | None, str]:
+            async with semaphore:
+                # Each gathered coroutine runs in its own task, so this buffer
+                # only collects output from this server's conversion
+                buffer: list[str] = []
+                _output_buffer.set(buffer)
+                try:
+                    tools = prefetched.get(config_path)
+                    if isinstance(tools, BaseException):
+                        raise tools
+                    skill_dir = await self.converter.aconvert(
+                        config_path,
+                        output_dir,
+                        compact_mode=compact_mode,
+                        config=self._split_configs.get(config_path),
+                        tools=tools,
+                    )
+                except Exception as e:
+                    buffer.append(f"[red]Failed to convert {config_path.name}: {e}[/red]")
+                    progress.console.print("\n".join(buffer))
+                    status = "timeout" if isinstance(e, TimeoutError) else "error"
+                    record(config_path, status=status, error=str(e))
+                    return config_path, None, str(e)
+                finally:
+                    progress.advance(task_id)
+                # Successful servers only show up on the bar, plus any warnings
+                notices = [line for line in buffer if line.lstrip().startswith(_NOTICE_MARKUP)]
+                if notices:
+                    progress.console.print(f"[bold]{config_path.stem}[/bold]", *notices, sep="\n")
+                record(config_path, status="success", output_dir=str(skill_dir))
+                return config_path, skill_dir, ""
+
+        try:
+            with progress:
+                return await asyncio.gather(*(convert_one(p) for p in configs))
+        finally:
+            await self.converter.ai_generator.aclose()
+            if results_log is not None:
+                results_log.close()
@@ -0,0 +1,75 @@
+"""Persistent exact-match cache for LLM responses."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any
+
+DEFAULT_CACHE_PATH = Path.home() / ".mcp2skills" / "llm_cache.sqlite"
+
+# Deletes the separators that vary between spellings of a parameter name
+_NAME_SEPARATORS = str.maketrans("", "", "_-")
+
+
+def make_cache_key(
+    model: str, messages: list[dict[str, Any]], temperature: float, max_tokens: int
+) -> str:
+    """Hash everything that determines an LLM response into a stable cache key."""
+    request: dict[str, Any] = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+    encoded = json.dumps(request, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def make_param_key(model: str, tool_name: str, param_name: str, schema: dict[str, Any]) -> str:
+    """Key a parameter description by its tool, spelling-insensitive name and exact schema.
+
+    "repo_name", "repo-name" and "repoName" share a key, so one description is
+    reused for the same parameter of same-named tools, including across servers.
+    The tool is part of the key because a name like "number" means different
+    things on different tools.
+    """
+    tool = tool_name.lower().translate(_NAME_SEPARATORS)
+    name = param_name.lower().translate(_NAME_SEPARATORS)
+    request = {"model": model, "tool": tool, "param": name, "schema": schema}
+    encoded = json.dumps(request, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return "param:" + hashlib.sha256(encoded).hexdigest()
+
+
+class LLMCache:
+    """SQLite-backed key/value store of LLM response texts."""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Calls can come from worker threads as well as the event loop thread
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for key, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response under key, replacing any previous value."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)", (key, value)
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -19,9 +19,16 @@ import time
 import argparse
 import subprocess
 import io
+import select
 from pathlib import Path
-from urllib.request import urlopen, Request
-from urllib.error import URLError, HTTPError
+from http.client import HTTPConnection, HTTPException, RemoteDisconnected
+from urllib.parse import quote
+
+# Prefer orjson's C parser when it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 # Fix Windows console encoding
 if sys.platform == "win32":
@@ -39,18 +46,71 @@ STARTUP_TIMEOUT = 15  # seconds
 
 
 class DaemonClient:
-    """Client for communicating with MCP daemon service."""
+    """Client for communicating with MCP daemon service.
+
+    Requests share one keep-alive HTTP connection, so the health check made by
+    start_daemon() and the actual request do not each open a new socket.
+    """
 
     def __init__(self):
         self.base_url = DAEMON_URL
+        self._conn = None
+
+    def _request(self, method: str, path: str, body: bytes = None, timeout: float = 30):
+        """Send a request to the daemon; returns (status code, response body).
+
+        A reused connection is only retried when it turns out the daemon had
+        already closed it: the send failed, or a GET got no response at all.
+        POSTs whose outcome is unknown and timeouts are never resent, so a
+        tool call cannot run twice.
+        """
+        headers = {"Content-Type": "application/json"} if body is not None else {}
+        if self._conn is not None and self._is_stale():
+            self.close()
+        while True:
+            reused = self._conn is not None
+            if not reused:
+                self._conn = HTTPConnection(DAEMON_HOST, DAEMON_PORT, timeout=timeout)
+            elif self._conn.sock is not None:
+                self._conn.sock.settimeout(timeout)
+            sent = False
+            try:
+                self._conn.request(method, path, body=body, headers=headers)
+                sent = True
+                response = self._conn.getresponse()
+                return response.status, response.read()
+            except (RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                self.close()
+                if not reused or (sent and method != "GET"):
+                    raise
+            except (HTTPException, OSError):
+                self.close()
+                raise
+
+    def _is_stale(self) -> bool:
+        """Check whether the daemon has closed the idle kept-alive connection."""
+        sock = self._conn.sock
+        if sock is None:
+            return False
+        try:
+            # An idle connection only becomes readable once the daemon closes it
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+    def close(self) -> None:
+        """Close the kept-alive connection, if any."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
     def is_running(self) -> bool:
         """Check if daemon is running and responsive."""
         try:
-            response = urlopen(f"{self.base_url}/health", timeout=2)
-            data = json.loads(response.read().decode())
-            return data.get("running", False)
-        except (URLError, HTTPError, TimeoutError, ConnectionRefusedError):
+            status, body = self._request("GET", "/health", timeout=2)
+            return status == 200 and json_loads(body).get("running", False)
+        except (HTTPException, OSError, ValueError):
             return False
 
     def start_daemon(self) -> bool:
@@ -90,10 +150,12 @@ class DaemonClient:
                 start_new_session=True
             )
 
-        # Wait for daemon to start
+        # Wait for daemon to start, polling quickly at first then backing off
         start_time = time.time()
+        delay = 0.05
         while time.time() - start_time < STARTUP_TIMEOUT:
-            time.sleep(0.5)
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
             if self.is_running():
                 print(f"Daemon started (PID: {process.pid})", file=sys.stderr)
                 return True
@@ -104,19 +166,20 @@ class DaemonClient:
     def stop_daemon(self) -> bool:
         """Stop the daemon process."""
         try:
-            req = Request(f"{self.base_url}/shutdown", method="POST")
-            urlopen(req, timeout=5)
+            self._request("POST", "/shutdown", timeout=5)
             print("Daemon shutdown requested", file=sys.stderr)
             return True
         except Exception as e:
             print(f"Error stopping daemon: {e}", file=sys.stderr)
             return False
+        finally:
+            self.close()
 
     def get_status(self) -> dict:
         """Get daemon status."""
         try:
-            response = urlopen(f"{self.base_url}/health", timeout=5)
-            return json.loads(response.read().decode())
+            _, body = self._request("GET", "/health", timeout=5)
+            return json_loads(body)
         except Exception as e:
             return {"error": str(e), "running": False}
 
@@ -126,9 +189,8 @@ class DaemonClient:
             raise RuntimeError("Failed to start daemon")
 
         try:
-            response = urlopen(f"{self.base_url}/tools", timeout=30)
-            data = json.loads(response.read().decode())
-            return data.get("tools", [])
+            _, body = self._request("GET", "/tools", timeout=30)
+            return json_loads(body).get("tools", [])
         except Exception as e:
             raise RuntimeError(f"Failed to list tools: {e}")
 
@@ -138,51 +200,67 @@ class DaemonClient:
             raise RuntimeError("Failed to start daemon")
 
         try:
-            response = urlopen(f"{self.base_url}/tools/{tool_name}", timeout=30)
-            data = json.loads(response.read().decode())
-            return data.get("tool", {})
-        except HTTPError as e:
-            if e.code == 404:
-                raise RuntimeError(f"Tool not found: {tool_name}")
-            raise RuntimeError(f"Failed to describe tool: {e}")
+            status, body = self._request("GET", f"/tools/{quote(tool_name)}", timeout=30)
         except Exception as e:
             raise RuntimeError(f"Failed to describe tool: {e}")
+        if status == 404:
+            raise RuntimeError(f"Tool not found: {tool_name}")
+        if status != 200:
+            raise RuntimeError(f"Failed to describe tool: HTTP {status}")
+        return json_loads(body).get("tool", {})
 
     def call_tool(self, tool_name: str, arguments: dict) -> list:
         """Call a tool on the MCP server."""
         if not self.start_daemon():
             raise RuntimeError("Failed to start daemon")
 
+        payload = json.dumps({
+            "tool": tool_name,
+            "arguments": arguments
+        }).encode()
+
         try:
-            payload = json.dumps({
-                "tool": tool_name,
-                "arguments": arguments
-            }).encode()
-
-            req = Request(
-                f"{self.base_url}/call",
-                data=payload,
-                headers={"Content-Type": "application/json"},
-                method="POST"
-            )
+            # Long timeout for tool execution
+            status, body = self._request("POST", "/call", body=payload, timeout=120)
+        except Exception as e:
+            raise RuntimeError(f"Tool call failed: {e}")
 
-            response = urlopen(req, timeout=120)  # Long timeout for tool execution
-            data = json.loads(response.read().decode())
+        try:
+            data = json_loads(body)
+        except ValueError:
+            raise RuntimeError(f"Tool call failed: {body.decode(errors='replace')}")
 
-            if "error" in data:
-                raise RuntimeError(data["error"])
+        if status != 200:
+            raise RuntimeError(data.get("error", f"HTTP {status}"))
+        if "error" in data:
+            raise RuntimeError(f"Tool call failed: {data['error']}")
 
-            return data.get("result", [])
+        return data.get("result", [])
 
-        except HTTPError as e:
-            error_body = e.read().decode() if e.fp else str(e)
-            try:
-                error_data = json.loads(error_body)
-                raise RuntimeError(error_data.get("error", str(e)))
-            except json.JSONDecodeError:
-                raise RuntimeError(f"Tool call failed: {error_body}")
+    def call_tools(self, calls: list, max_concurrent: int = 8, stop_on_error: bool = False) -> list:
+        """Call several tools concurrently in the daemon with a single request.
+
+        Returns one {index, tool, ok, result or error} row per call, in order.
+        """
+        if not self.start_daemon():
+            raise RuntimeError("Failed to start daemon")
+
+        payload = json.dumps({
+            "calls": calls,
+            "max_concurrent": max_concurrent,
+            "stop_on_error": stop_on_error
+        }).encode()
+
+        try:
+            status, body = self._request("POST", "/batch", body=payload, timeout=300)
+            data = json_loads(body)
         except Exception as e:
-            raise RuntimeError(f"Tool call failed: {e}")
+            raise RuntimeError(f"Batch call failed: {e}")
+
+        if status != 200:
+            raise RuntimeError(data.get("error", f"HTTP {status}"))
+
+        return data.get("results", [])
 
 
 def format_output(obj) -> str:
@@ -212,6 +290,9 @@ Examples:
   # Call a tool
   python executor.py --call '{"tool": "take_snapshot", "arguments": {}}'
 
+  # Call several tools in parallel with one request
+  python executor.py --batch '[{"tool": "take_snapshot", "arguments": {}}]'
+
   # Check daemon status
   python executor.py --status
 
@@ -223,6 +304,15 @@ Examples:
     parser.add_argument("--list", action="store_true", help="List available tools")
     parser.add_argument("--describe", metavar="TOOL", help="Describe a specific tool")
     parser.add_argument("--call", metavar="JSON", help="Call a tool with JSON arguments")
+    parser.add_argument(
+        "--batch", metavar="JSON", help="Call several tools from a JSON array of {tool, arguments}"
+    )
+    parser.add_argument(
+        "--max-concurrent", type=int, default=8, help="Max parallel calls in --batch (default: 8)"
+    )
+    parser.add_argument(
+        "--stop-on-error", action="store_true", help="Skip remaining --batch calls after a failure"
+    )
     parser.add_argument("--status", action="store_true", help="Show daemon status")
     parser.add_argument("--stop", action="store_true", help="Stop the daemon")
     parser.add_argument("--start", action="store_true", help="Start the daemon")
@@ -267,7 +357,7 @@ Examples:
                 print(f"Parameters: {json.dumps(tool['inputSchema'], indent=2, ensure_ascii=False)}")
 
         elif args.call:
-            call_data = json.loads(args.call)
+            call_data = json_loads(args.call)
             tool_name = call_data.get("tool")
             arguments = call_data.get("arguments", {})
 
@@ -280,6 +370,15 @@ Examples:
             for item in result:
                 print(format_output(item))
 
+        elif args.batch:
+            calls = json_loads(args.batch)
+            if not isinstance(calls, list) or not all(isinstance(c, dict) for c in calls):
+                print("Error: --batch expects a JSON array of objects", file=sys.stderr)
+                sys.exit(1)
+
+            rows = client.call_tools(calls, max(1, args.max_concurrent), args.stop_on_error)
+            print(json.dumps(rows, indent=2, ensure_ascii=False))
+
         else:
             parser.print_help()
 
@@ -289,6 +388,8 @@ Examples:
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        client.close()
 
 
 if __name__ == "__main__":
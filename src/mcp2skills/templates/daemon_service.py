@@ -85,7 +85,7 @@ class MCPDaemonService:
         self.connection_time: Optional[float] = None
         self.last_activity: Optional[float] = None
         self.reconnect_task: Optional[asyncio.Task] = None
-        self.timeout_task: Optional[asyncio.Task] = None
+        self.idle_timer: Optional[asyncio.TimerHandle] = None
         self._lock = asyncio.Lock()
 
     def load_config(self) -> dict:
@@ -93,8 +93,8 @@ class MCPDaemonService:
         if not CONFIG_PATH.exists():
             raise RuntimeError(f"Config not found: {CONFIG_PATH}")
 
-        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-            config = json.load(f)
+        with open(CONFIG_PATH, "rb") as f:
+            config = json.loads(f.read())
 
         # Fix command path for cross-platform compatibility
         command = config.get("command", "")
@@ -149,7 +149,7 @@ class MCPDaemonService:
 
                 self.connected = True
                 self.connection_time = time.time()
-                self.last_activity = time.time()
+                self.update_activity()
                 self.last_error = None
                 self.tools_cache = None  # Clear cache on reconnect
 
@@ -163,9 +163,21 @@ class MCPDaemonService:
                 return False
 
     def update_activity(self):
-        """Update last activity timestamp."""
+        """Update last activity timestamp and re-arm the idle timer."""
         self.last_activity = time.time()
 
+        if DAEMON_TIMEOUT <= 0 or not self.running:
+            return
+        if self.idle_timer:
+            self.idle_timer.cancel()
+        self.idle_timer = asyncio.get_running_loop().call_later(DAEMON_TIMEOUT, self._on_idle)
+
+    def _on_idle(self):
+        """Shut down once no request has arrived for DAEMON_TIMEOUT seconds."""
+        logger.info(f"Idle timeout ({DAEMON_TIMEOUT}s) exceeded, shutting down...")
+        # Let main() run the shutdown from the task that opened the connection
+        self.running = False
+
     async def ensure_connected(self) -> bool:
         """Ensure connection is established, reconnect if needed."""
         if not self.connected or not self.session:
@@ -207,14 +219,16 @@ class MCPDaemonService:
         return None
 
     async def call_tool(self, tool_name: str, arguments: dict) -> Any:
-        """Call a tool on the MCP server."""
+        """Call a tool on the MCP server; returns the full CallToolResult."""
         if not await self.ensure_connected():
             raise RuntimeError(f"Not connected to MCP server: {self.last_error}")
 
         try:
             logger.info(f"Calling tool: {tool_name}")
             result = await self.session.call_tool(tool_name, arguments)
-            return result.content
+            # Count the call's completion as activity so long calls don't idle out
+            self.update_activity()
+            return result
         except Exception as e:
             self.connected = False
             self.last_error = str(e)
@@ -225,12 +239,9 @@ class MCPDaemonService:
         logger.info("Shutting down daemon...")
         self.running = False
 
-        if self.timeout_task:
-            self.timeout_task.cancel()
-            try:
-                await self.timeout_task
-            except asyncio.CancelledError:
-                pass
+        if self.idle_timer:
+            self.idle_timer.cancel()
+            self.idle_timer = None
 
         if self.reconnect_task:
             self.reconnect_task.cancel()
@@ -312,6 +323,26 @@ async def handle_describe_tool(request):
         return web.json_response({"error": str(e)}, status=500)
 
 
+def is_error_result(result) -> bool:
+    """Check a CallToolResult's error flag under either SDK spelling."""
+    return bool(getattr(result, "isError", None) or getattr(result, "is_error", False))
+
+
+def format_result(result) -> list:
+    """Format a tool result for a JSON response."""
+    if not isinstance(result, list):
+        return [str(result)]
+    formatted_result = []
+    for item in result:
+        if hasattr(item, 'text'):
+            formatted_result.append({"type": "text", "content": item.text})
+        elif hasattr(item, '__dict__'):
+            formatted_result.append(item.__dict__)
+        else:
+            formatted_result.append(str(item))
+    return formatted_result
+
+
 async def handle_call_tool(request):
     """Call a tool."""
     try:
@@ -323,21 +354,7 @@ async def handle_call_tool(request):
             return web.json_response({"error": "Missing 'tool' parameter"}, status=400)
 
         result = await daemon.call_tool(tool_name, arguments)
-
-        # Format result for JSON response
-        formatted_result = []
-        if isinstance(result, list):
-            for item in result:
-                if hasattr(item, 'text'):
-                    formatted_result.append({"type": "text", "content": item.text})
-                elif hasattr(item, '__dict__'):
-                    formatted_result.append(item.__dict__)
-                else:
-                    formatted_result.append(str(item))
-        else:
-            formatted_result = [str(result)]
-
-        return web.json_response({"result": formatted_result})
+        return web.json_response({"result": format_result(result.content)})
 
     except json.JSONDecodeError:
         return web.json_response({"error": "Invalid JSON"}, status=400)
@@ -348,6 +365,56 @@ async def handle_call_tool(request):
         return web.json_response({"error": str(e)}, status=500)
 
 
+async def handle_batch(request):
+    """Call several tools concurrently, answering with one result row per call."""
+    try:
+        data = await request.json()
+    except json.JSONDecodeError:
+        return web.json_response({"error": "Invalid JSON"}, status=400)
+    if not isinstance(data, dict):
+        return web.json_response({"error": "Request body must be a JSON object"}, status=400)
+
+    calls = data.get("calls")
+    if not isinstance(calls, list) or not all(isinstance(c, dict) for c in calls):
+        return web.json_response({"error": "'calls' must be a list of objects"}, status=400)
+
+    try:
+        max_concurrent = max(1, int(data.get("max_concurrent", 8)))
+    except (TypeError, ValueError):
+        return web.json_response({"error": "'max_concurrent' must be an integer"}, status=400)
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+    stop_on_error = bool(data.get("stop_on_error", False))
+    failed = asyncio.Event()
+
+    async def run_one(index: int, call: dict) -> dict:
+        tool_name = call.get("tool")
+        row = {"index": index, "tool": tool_name}
+        async with semaphore:
+            if stop_on_error and failed.is_set():
+                return {**row, "ok": False, "error": "Skipped after an earlier failure"}
+            try:
+                if not tool_name:
+                    raise ValueError("Missing 'tool' in call")
+                result = await daemon.call_tool(tool_name, call.get("arguments", {}))
+            except Exception as e:
+                failed.set()
+                return {**row, "ok": False, "error": str(e)}
+
+        output = format_result(result.content)
+        if is_error_result(result):
+            failed.set()
+            messages = [
+                item["content"] if isinstance(item, dict) and "content" in item else str(item)
+                for item in output
+            ]
+            return {**row, "ok": False, "error": "\\n".join(messages)}
+        return {**row, "ok": True, "result": output}
+
+    results = await asyncio.gather(*(run_one(i, c) for i, c in enumerate(calls)))
+    return web.json_response({"results": results})
+
+
 async def handle_shutdown(request):
     """Shutdown the daemon."""
     asyncio.create_task(shutdown_server())
@@ -389,6 +456,7 @@ async def start_server():
     app.router.add_get("/tools", handle_list_tools)
     app.router.add_get("/tools/{name}", handle_describe_tool)
     app.router.add_post("/call", handle_call_tool)
+    app.router.add_post("/batch", handle_batch)
     app.router.add_post("/shutdown", handle_shutdown)
 
     runner = web.AppRunner(app)
@@ -401,21 +469,6 @@ async def start_server():
     return runner
 
 
-async def check_timeout():
-    """Check for inactivity timeout and shutdown if exceeded."""
-    if DAEMON_TIMEOUT <= 0:
-        return  # No timeout configured
-
-    while daemon.running:
-        await asyncio.sleep(60)  # Check every minute
-        if daemon.last_activity:
-            idle_time = time.time() - daemon.last_activity
-            if idle_time > DAEMON_TIMEOUT:
-                logger.info(f"Idle timeout ({DAEMON_TIMEOUT}s) exceeded, shutting down...")
-                await shutdown_server()
-                return
-
-
 async def main():
     """Main entry point."""
     # Write PID file
@@ -433,13 +486,13 @@ async def main():
     # Start HTTP server
     runner = await start_server()
 
-    # Start timeout checker if configured
+    # Arm the idle timer; every request pushes it back
     if DAEMON_TIMEOUT > 0:
-        daemon.timeout_task = asyncio.create_task(check_timeout())
+        daemon.update_activity()
         logger.info(f"Idle timeout: {DAEMON_TIMEOUT}s")
 
     logger.info(f"MCP Daemon running on http://{DAEMON_HOST}:{DAEMON_PORT}")
-    logger.info("Endpoints: /health, /tools, /tools/<name>, /call, /shutdown")
+    logger.info("Endpoints: /health, /tools, /tools/<name>, /call, /batch, /shutdown")
 
     # Keep running
     try:
@@ -8,8 +8,10 @@ import json
 import sys
 import asyncio
 import argparse
+import hashlib
 import io
 import os
+import time
 from pathlib import Path
 
 # Fix Windows console encoding issues
@@ -23,16 +25,31 @@ except ImportError:
     print("Error: mcp package not installed. Run: pip install mcp")
     sys.exit(1)
 
+# Prefer orjson's C parser when it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Configuration
+SKILL_DIR = Path(__file__).parent
+CONFIG_PATH = SKILL_DIR / "mcp-config.json"
+TOOLS_CACHE_PATH = SKILL_DIR / ".tools-cache.json"
+DEFAULT_CACHE_TTL = 86400  # seconds, overridden by cache_ttl_seconds in mcp-config.json
+
+# In-process tool list memo, keyed on the config file's content digest
+_TOOLS_CACHE: dict = {}
+
 
 def load_config() -> dict:
     """Load MCP configuration from mcp-config.json."""
-    config_path = Path(__file__).parent / "mcp-config.json"
+    config_path = CONFIG_PATH
     if not config_path.exists():
         print(f"Error: Config file not found: {config_path}")
         sys.exit(1)
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = json.load(f)
+    with open(config_path, "rb") as f:
+        config = json_loads(f.read())
 
     # Fix command path for cross-platform compatibility (stdio only)
     if config.get("type") == "stdio":
@@ -138,6 +155,114 @@ async def call_tool(config: dict, tool_name: str, arguments: dict) -> any:
             await http_client.aclose()
 
 
+async def call_tools_batch(
+    config: dict, calls: list, max_concurrent: int = 8, stop_on_error: bool = False
+) -> list:
+    """Run several tool calls concurrently over a single MCP session."""
+    client_context, http_client = await connect_to_server(config)
+
+    try:
+        async with client_context as streams:
+            # Extract read/write streams based on transport type
+            if config.get("type") == "streamable-http":
+                read, write, _ = streams
+            else:
+                read, write = streams
+
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                semaphore = asyncio.Semaphore(max_concurrent)
+                failed = asyncio.Event()
+
+                async def run_one(index: int, call: dict) -> dict:
+                    tool_name = call.get("tool")
+                    row = {"index": index, "tool": tool_name}
+                    async with semaphore:
+                        if stop_on_error and failed.is_set():
+                            return {**row, "ok": False, "error": "Skipped after an earlier failure"}
+                        try:
+                            if not tool_name:
+                                raise ValueError("Missing 'tool' in call")
+                            result = await session.call_tool(tool_name, call.get("arguments", {}))
+                        except Exception as e:
+                            failed.set()
+                            return {**row, "ok": False, "error": str(e)}
+
+                    output = [safe_output(item) for item in result.content]
+                    if getattr(result, "isError", None) or getattr(result, "is_error", False):
+                        failed.set()
+                        return {**row, "ok": False, "error": "\\n".join(output)}
+                    return {**row, "ok": True, "result": output}
+
+                return await asyncio.gather(*(run_one(i, c) for i, c in enumerate(calls)))
+    finally:
+        if http_client:
+            await http_client.aclose()
+
+
+def config_digest() -> str:
+    """SHA-256 of mcp-config.json, which survives copies that reset file times."""
+    return hashlib.sha256(CONFIG_PATH.read_bytes()).hexdigest()
+
+
+def load_cached_tools(digest: str, ttl: float):
+    """Return the tool list from the disk cache, or None if missing or stale."""
+    try:
+        with open(TOOLS_CACHE_PATH, "rb") as f:
+            cache = json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+    if cache.get("config_sha256") != digest:
+        return None
+    if time.time() - cache.get("created_at", 0) > ttl:
+        return None
+    return cache.get("tools")
+
+
+def save_cached_tools(digest: str, tools: list) -> None:
+    """Atomically write the tool list to the disk cache (best effort)."""
+    data = {"config_sha256": digest, "created_at": time.time(), "tools": tools}
+    tmp_path = TOOLS_CACHE_PATH.with_name(f"{TOOLS_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        os.replace(tmp_path, TOOLS_CACHE_PATH)
+    except OSError:
+        # A read-only skill directory just means no caching
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def get_tools_cached(config: dict) -> list:
+    """Get the tool list as dicts, served from cache when it is still fresh."""
+    digest = config_digest()
+    if digest in _TOOLS_CACHE:
+        return _TOOLS_CACHE[digest]
+
+    ttl = config.get("cache_ttl_seconds", DEFAULT_CACHE_TTL)
+    tools = load_cached_tools(digest, ttl) if ttl > 0 else None
+    if tools is None:
+        tools = [
+            {
+                "name": tool.name,
+                "description": tool.description or "",
+                # mcp 1.x spells it inputSchema, later releases input_schema
+                "inputSchema": (
+                    getattr(tool, "inputSchema", None) or getattr(tool, "input_schema", None) or {}
+                ),
+            }
+            for tool in asyncio.run(get_tools(config))
+        ]
+        if ttl > 0:
+            save_cached_tools(digest, tools)
+
+    _TOOLS_CACHE[digest] = tools
+    return tools
+
+
 def safe_output(obj) -> str:
     """Safely convert object to string for output."""
     try:
@@ -158,38 +283,52 @@ def main():
     parser.add_argument("--list", action="store_true", help="List available tools")
     parser.add_argument("--describe", metavar="TOOL", help="Describe a specific tool")
     parser.add_argument("--call", metavar="JSON", help="Call a tool with JSON arguments")
+    parser.add_argument(
+        "--batch", metavar="JSON", help="Call several tools from a JSON array of {tool, arguments}"
+    )
+    parser.add_argument(
+        "--max-concurrent", type=int, default=8, help="Max parallel calls in --batch (default: 8)"
+    )
+    parser.add_argument(
+        "--stop-on-error", action="store_true", help="Skip remaining --batch calls after a failure"
+    )
 
     args = parser.parse_args()
     config = load_config()
 
     try:
         if args.list:
-            tools = asyncio.run(get_tools(config))
+            tools = get_tools_cached(config)
             print(f"Available tools ({len(tools)}):\\n")
             for tool in tools:
-                print(f"  - {tool.name}")
-                if tool.description:
-                    desc = tool.description[:80] + "..." if len(tool.description) > 80 else tool.description
+                print(f"  - {tool['name']}")
+                if tool.get('description'):
+                    desc = tool['description'][:80] + "..." if len(tool['description']) > 80 else tool['description']
                     print(f"    {desc}")
             print()
 
         elif args.describe:
-            tools = asyncio.run(get_tools(config))
-            tool = next((t for t in tools if t.name == args.describe), None)
+            tools = get_tools_cached(config)
+            tool = next((t for t in tools if t["name"] == args.describe), None)
             if not tool:
                 print(f"Tool not found: {args.describe}")
                 sys.exit(1)
 
-            print(f"Tool: {tool.name}")
-            print(f"Description: {tool.description or '(none)'}")
-            if hasattr(tool, "inputSchema") and tool.inputSchema:
-                print(f"Parameters: {json.dumps(tool.inputSchema, indent=2, ensure_ascii=False)}")
+            print(f"Tool: {tool['name']}")
+            print(f"Description: {tool.get('description') or '(none)'}")
+            if tool.get("inputSchema"):
+                print(f"Parameters: {json.dumps(tool['inputSchema'], indent=2, ensure_ascii=False)}")
 
         elif args.call:
-            call_data = json.loads(args.call)
+            call_data = json_loads(args.call)
+            tool_name = call_data.get("tool")
+            if not tool_name:
+                print("Error: Missing 'tool' in JSON", file=sys.stderr)
+                sys.exit(1)
+
             result = asyncio.run(call_tool(
                 config,
-                call_data["tool"],
+                tool_name,
                 call_data.get("arguments", {})
             ))
 
@@ -199,6 +338,20 @@ def main():
             else:
                 print(safe_output(result))
 
+        elif args.batch:
+            calls = json_loads(args.batch)
+            if not isinstance(calls, list) or not all(isinstance(c, dict) for c in calls):
+                print("Error: --batch expects a JSON array of objects", file=sys.stderr)
+                sys.exit(1)
+
+            rows = asyncio.run(call_tools_batch(
+                config,
+                calls,
+                max(1, args.max_concurrent),
+                args.stop_on_error
+            ))
+            print(json.dumps(rows, indent=2, ensure_ascii=False))
+
         else:
             parser.print_help()
 
@@ -210,3 +363,6 @@ def main():
 if __name__ == "__main__":
     main()
 '''
+
+# The template is static, so it is encoded once rather than once per skill
+EXECUTOR_TEMPLATE_BYTES = EXECUTOR_TEMPLATE.encode("utf-8")
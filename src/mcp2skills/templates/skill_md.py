@@ -2,6 +2,62 @@
 
 from typing import Any
 
+# Common action prefixes used to group tools
+_ACTION_PREFIXES = (
+    "create",
+    "get",
+    "list",
+    "update",
+    "delete",
+    "search",
+    "add",
+    "remove",
+    "set",
+    "read",
+    "write",
+    "edit",
+    "push",
+    "pull",
+    "merge",
+    "fork",
+    "close",
+    "open",
+)
+
+# Static sections, built once rather than on every generate_skill_md() call
+_STANDARD_EXECUTION_SECTION = """### Execution
+
+Use the executor to interact with tools. The executor automatically handles cross-platform compatibility.
+
+```bash
+# List all available tools
+python executor.py --list
+
+# Get detailed info about a specific tool
+python executor.py --describe <tool_name>
+
+# Execute a tool
+python executor.py --call '{"tool": "<tool_name>", "arguments": {...}}'
+
+# Execute several tools in parallel over one connection
+python executor.py --batch '[{"tool": "<tool_name>", "arguments": {...}}, ...]'
+```
+
+**Note**: On Windows, run from the skill directory or use the full path with forward slashes.
+
+### Error Handling
+
+If execution fails:
+1. Verify tool name with `--list`
+2. Check parameter format with `--describe <tool_name>`
+3. Ensure MCP server dependencies are installed"""
+
+_REFERENCE_NOTE = """
+> **Note**: For detailed parameter documentation, run `python executor.py --describe <tool_name>`
+> or see `references/tools.md` for the complete API reference.
+
+"""
+
 
 def generate_skill_md(
     server_name: str,
@@ -34,7 +90,7 @@ def generate_skill_md(
     if is_daemon:
         execution_section = _generate_daemon_execution_section(daemon_timeout)
     else:
-        execution_section = _generate_standard_execution_section()
+        execution_section = _STANDARD_EXECUTION_SECTION
 
     # Build the SKILL.md content
     content = f"""---
@@ -63,33 +119,6 @@ description: >-
     return content
 
 
-def _generate_standard_execution_section() -> str:
-    """Generate execution section for standard mode."""
-    return """### Execution
-
-Use the executor to interact with tools. The executor automatically handles cross-platform compatibility.
-
-```bash
-# List all available tools
-python executor.py --list
-
-# Get detailed info about a specific tool
-python executor.py --describe <tool_name>
-
-# Execute a tool
-python executor.py --call '{"tool": "<tool_name>", "arguments": {...}}'
-```
-
-**Note**: On Windows, run from the skill directory or use the full path with forward slashes.
-
-### Error Handling
-
-If execution fails:
-1. Verify tool name with `--list`
-2. Check parameter format with `--describe <tool_name>`
-3. Ensure MCP server dependencies are installed"""
-
-
 def _generate_daemon_execution_section(daemon_timeout: int = 0) -> str:
     """Generate execution section for daemon mode."""
     timeout_note = ""
@@ -113,7 +142,10 @@ python executor.py --list
 python executor.py --describe <tool_name>
 
 # Execute a tool
-python executor.py --call '{"tool": "<tool_name>", "arguments": {...}}'
+python executor.py --call '{{"tool": "<tool_name>", "arguments": {{...}}}}'
+
+# Execute several tools in parallel with one daemon request
+python executor.py --batch '[{{"tool": "<tool_name>", "arguments": {{...}}}}, ...]'
 
 # Check daemon status
 python executor.py --status
@@ -163,11 +195,7 @@ def _generate_reference_note(tools: list[dict[str, Any]], compact: bool) -> str:
     """Generate a note pointing to the references file if in compact mode."""
     if not compact or len(tools) <= 5:
         return ""
-    return """
-> **Note**: For detailed parameter documentation, run `python executor.py --describe <tool_name>`
-> or see `references/tools.md` for the complete API reference.
-
-"""
+    return _REFERENCE_NOTE
 
 
 def _generate_tool_docs(tools: list[dict[str, Any]], compact: bool = False) -> str:
@@ -190,7 +218,7 @@ def _generate_tool_docs(tools: list[dict[str, Any]], compact: bool = False) -> s
             lines.append("")
 
         for tool in group_tools:
-            lines.extend(_format_tool(tool, compact=compact))
+            _format_tool(tool, lines, compact=compact)
             lines.append("")
 
     return "\n".join(lines).rstrip()
@@ -203,45 +231,20 @@ def _group_tools(tools: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]
 
     groups: dict[str, list[dict[str, Any]]] = {}
 
-    # Common action prefixes
-    action_prefixes = [
-        "create",
-        "get",
-        "list",
-        "update",
-        "delete",
-        "search",
-        "add",
-        "remove",
-        "set",
-        "read",
-        "write",
-        "edit",
-        "push",
-        "pull",
-        "merge",
-        "fork",
-        "close",
-        "open",
-    ]
-
     for tool in tools:
         name = tool.get("name", "").lower()
         group_name = ""
 
         # Try to find a matching action prefix
-        for prefix in action_prefixes:
-            if name.startswith(prefix + "_") or name.startswith(prefix):
+        for prefix in _ACTION_PREFIXES:
+            if name.startswith(prefix):
                 group_name = prefix.capitalize() + " Operations"
                 break
 
         # Fallback: use first word
         if not group_name:
-            parts = name.replace("-", "_").split("_")
-            if len(parts) > 1:
-                group_name = parts[0].capitalize()
-            else:
-                group_name = "Other"
+            head, sep, _ = name.replace("-", "_").partition("_")
+            group_name = head.capitalize() if sep else "Other"
 
         if group_name not in groups:
             groups[group_name] = []
@@ -263,14 +266,26 @@ def _group_tools(tools: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]
     return sorted_groups
 
 
-def _format_tool(tool: dict[str, Any], compact: bool = False) -> list[str]:
-    """Format a single tool's documentation.
+def _partition_params(
+    schema: dict[str, Any],
+) -> tuple[list[tuple[str, dict[str, Any]]], list[tuple[str, dict[str, Any]]]]:
+    """Split a tool's parameters into (required, optional) in a single pass."""
+    required = set(schema.get("required", []))
+    req_params: list[tuple[str, dict[str, Any]]] = []
+    opt_params: list[tuple[str, dict[str, Any]]] = []
+    for param in schema.get("properties", {}).items():
+        (req_params if param[0] in required else opt_params).append(param)
+    return req_params, opt_params
+
+
+def _format_tool(tool: dict[str, Any], lines: list[str], compact: bool = False) -> None:
+    """Append a single tool's documentation to lines.
 
     Args:
         tool: Tool definition dict
+        lines: Output lines to append to
         compact: If True, only show name and brief description (no parameters)
     """
-    lines = []
     name = tool.get("name", "unknown")
     description = tool.get("description", "")
 
@@ -291,39 +306,30 @@ def _format_tool(tool: dict[str, Any], compact: bool = False) -> list[str]:
 
     # In compact mode, skip parameter details
     if compact:
-        return lines
+        return
 
     # Parameters (only in non-compact mode)
-    schema = tool.get("inputSchema", {})
-    properties = schema.get("properties", {})
-    required = set(schema.get("required", []))
-
-    if properties:
-        # Required parameters
-        req_params = [(k, v) for k, v in properties.items() if k in required]
-        opt_params = [(k, v) for k, v in properties.items() if k not in required]
-
-        if req_params:
-            lines.append("    - **Required parameters**:")
-            for param_name, param_schema in req_params:
-                param_type = param_schema.get("type", "any")
-                param_desc = param_schema.get("description", "")
-                if param_desc:
-                    lines.append(f"      - `{param_name}` ({param_type}): {param_desc}")
-                else:
-                    lines.append(f"      - `{param_name}` ({param_type})")
-
-        if opt_params:
-            lines.append("    - **Optional parameters**:")
-            for param_name, param_schema in opt_params:
-                param_type = param_schema.get("type", "any")
-                param_desc = param_schema.get("description", "")
-                if param_desc:
-                    lines.append(f"      - `{param_name}` ({param_type}): {param_desc}")
-                else:
-                    lines.append(f"      - `{param_name}` ({param_type})")
-
-    return lines
+    req_params, opt_params = _partition_params(tool.get("inputSchema", {}))
+
+    if req_params:
+        lines.append("    - **Required parameters**:")
+        for param_name, param_schema in req_params:
+            param_type = param_schema.get("type", "any")
+            param_desc = param_schema.get("description", "")
+            if param_desc:
+                lines.append(f"      - `{param_name}` ({param_type}): {param_desc}")
+            else:
+                lines.append(f"      - `{param_name}` ({param_type})")
+
+    if opt_params:
+        lines.append("    - **Optional parameters**:")
+        for param_name, param_schema in opt_params:
+            param_type = param_schema.get("type", "any")
+            param_desc = param_schema.get("description", "")
+            if param_desc:
+                lines.append(f"      - `{param_name}` ({param_type}): {param_desc}")
+            else:
+                lines.append(f"      - `{param_name}` ({param_type})")
 
 
 def generate_tools_reference(
@@ -354,14 +360,9 @@ def generate_tools_reference(
             lines.append(description)
             lines.append("")
 
-        schema = tool.get("inputSchema", {})
-        properties = schema.get("properties", {})
-        required = set(schema.get("required", []))
-
-        if properties:
-            req_params = [(k, v) for k, v in properties.items() if k in required]
-            opt_params = [(k, v) for k, v in properties.items() if k not in required]
+        req_params, opt_params = _partition_params(tool.get("inputSchema", {}))
 
+        if req_params or opt_params:
             if req_params:
                 lines.append("**Required Parameters:**")
                 lines.append("")
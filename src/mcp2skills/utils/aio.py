@@ -0,0 +1,30 @@
+"""Event loop helpers shared by the converter and the AI generator."""
+
+import asyncio
+import sys
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """asyncio.run() with eager tasks where supported (Python 3.12+).
+
+    Eager tasks run synchronously until their first real suspension, so the
+    many small gathered tasks of a conversion skip a scheduler round-trip.
+    """
+    if sys.version_info < (3, 12):
+        return asyncio.run(coro)
+    loop = asyncio.new_event_loop()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
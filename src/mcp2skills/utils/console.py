@@ -0,0 +1,7 @@
+"""Rich console shared by all mcp2skills modules."""
+
+from rich.console import Console
+
+# One console keeps output from the CLI, converter and AI generator on the same
+# stream, so it cooperates with live displays such as the batch progress bar
+console = Console()
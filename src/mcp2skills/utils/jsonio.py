@@ -0,0 +1,60 @@
+"""JSON encode/decode helpers that use orjson when it is installed."""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:
+    ijson = None  # type: ignore[assignment, unused-ignore]
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to 2-space indented UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Serialize an object as one compact, newline-terminated JSON Lines record."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def read_json(path: Path) -> Any:
+    """Load a JSON file with a single read, bypassing text decoding."""
+    return loads(path.read_bytes())
+
+
+def write_json(path: Path, obj: Any) -> None:
+    """Write an object as indented JSON with a single write."""
+    path.write_bytes(dumps(obj))
+
+
+def iter_object_items(path: Path, key: str) -> Iterator[tuple[str, Any]]:
+    """Yield (name, value) pairs of the object stored under a top-level key.
+
+    With ijson installed the file is parsed incrementally, so only one entry
+    is held in memory at a time; otherwise the whole file is loaded.
+    """
+    if ijson is not None:
+        with open(path, "rb") as f:
+            yield from ijson.kvitems(f, key, use_float=True)
+    else:
+        yield from read_json(path).get(key, {}).items()